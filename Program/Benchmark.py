@@ -0,0 +1,98 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Benchmark.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import argparse
+import os
+import pickle
+import time
+import numpy as np
+from Engine import WORDS_FILE, WordEngine
+from Patterns import PATTERNS_FILE, PatternMatrix
+from Recommender import Recommender, _score_block
+
+EMPTY_TASKS = 200
+
+def timed(function, *args):
+    """
+    --------------------------------------------------------
+    Runs a function and measures how long it took.
+    Use: result, seconds = timed(function, *args)
+    --------------------------------------------------------
+    Parameters:
+        function - The function to run (callable)
+        args - The arguments of the function
+    Returns:
+        The result of the function and the time in seconds
+        (tuple)
+    --------------------------------------------------------
+    """
+    start = time.perf_counter()
+    result = function(*args)
+
+    return result, time.perf_counter() - start
+
+
+def main():
+    """
+    --------------------------------------------------------
+    Compares scoring in one process with scoring over a
+    process pool that reads shared memory, and measures the
+    cost of a single pool task.
+    Use: python Benchmark.py --workers 4
+    --------------------------------------------------------
+    Parameters:
+        None
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    parser = argparse.ArgumentParser(description="Measures the overhead of parallel scoring.")
+    parser.add_argument("--workers", type=int, default=max(os.cpu_count() or 1, 2), help="amount of processes")
+    parser.add_argument("--share-matrix", action="store_true", help="copy the pattern matrix into shared memory")
+    args = parser.parse_args()
+
+    engine = WordEngine.load(WORDS_FILE)
+    matrix = PatternMatrix(engine, PATTERNS_FILE)
+    serial = Recommender(matrix, 1)
+    parallel = Recommender(matrix, args.workers, args.share_matrix)
+    rng = np.random.default_rng(0)
+
+    try:
+        # The first call starts the workers, which is not part of any task
+        _, seconds = timed(parallel.scores, engine.all_ids()[:2])
+        print("Pool start: {:.1f} ms".format(seconds * 1000))
+
+        futures = []
+        start = time.perf_counter()
+        for _ in range(EMPTY_TASKS):
+            futures.append(parallel._pool.submit(_score_block, 0, 0, 0))
+        for future in futures:
+            future.result()
+        seconds = time.perf_counter() - start
+        print("Empty task round trip: {:.1f} us per task".format(seconds / EMPTY_TASKS * 1e6))
+
+        for size in (len(engine), 1000, 100):
+            candidates = np.sort(rng.choice(len(engine), size, replace=False)).astype(np.int32)
+            expected, serial_seconds = timed(serial.scores, candidates)
+            result, parallel_seconds = timed(parallel.scores, candidates)
+
+            if(not np.allclose(expected, result)):
+                raise RuntimeError("Parallel scores do not match")
+
+            print("{:>6} candidates: serial {:8.1f} ms, {:} workers {:8.1f} ms, task payload {:} bytes "
+                  "(was {:,} with the ids pickled)".format(size, serial_seconds * 1000, args.workers,
+                                                           parallel_seconds * 1000, len(pickle.dumps((0, 256, size))),
+                                                           len(pickle.dumps((0, 256, candidates)))))
+    finally:
+        parallel.close()
+
+
+if(__name__ == "__main__"):
+    main()
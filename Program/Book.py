@@ -0,0 +1,348 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Book.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import argparse
+import os
+import time
+from collections import deque
+import numpy as np
+from Engine import add_engine_arguments, load_engine
+from Patterns import ALL_GREEN, PATTERN_COUNT, PATTERNS_FILE, load_matrix
+from Recommender import Recommender, partition_sizes
+
+BOOK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words.book")
+CRITERIA = ("worst", "expected")
+# The guess of each node is stored in 2 bytes
+MAX_WORDS = 1 << 16
+
+_MAGIC = b"WGBK"
+_VERSION = 2
+_HEADER = np.dtype([("magic", "S4"), ("version", "<u4"), ("digest", "u1", (32,)), ("answers", "u1", (32,)),
+                    ("criterion", "S8"), ("nodes", "<u4"), ("edges", "<u4")])
+
+def best_guess(matrix, candidates, criterion="worst"):
+    """
+    --------------------------------------------------------
+    Returns the guess that leaves the fewest candidates. With
+    the worst criterion the size of the largest group a guess
+    leaves is kept as small as possible, and with the
+    expected criterion the average size of the group the
+    answer ends up in. A guess that is the answer leaves no
+    group, so guesses that could still be the answer win
+    ties.
+    Use: guess = best_guess(matrix, candidates)
+    Use: guess = best_guess(matrix, candidates, criterion)
+    --------------------------------------------------------
+    Parameters:
+        matrix - The guess by answer patterns (PatternMatrix
+                 or TiledMatrix)
+        candidates - The ids of the remaining words
+                     (np.ndarray)
+        criterion - "worst" or "expected" (str)
+    Returns:
+        The id of the best guess (int)
+    --------------------------------------------------------
+    """
+    if(len(candidates) <= 2):
+        return int(candidates[0])
+
+    largest = []
+    squares = []
+
+    step = matrix.block_rows(len(candidates))
+
+    for start in range(0, len(matrix), step):
+        sizes = partition_sizes(matrix.rows(start, min(start + step, len(matrix)), candidates))
+        sizes[:, ALL_GREEN] = 0
+        largest.append(sizes.max(axis=1))
+        squares.append((sizes.astype(np.int64) ** 2).sum(axis=1))
+
+    largest = np.concatenate(largest)
+    squares = np.concatenate(squares)
+    possible = np.zeros(len(largest), dtype=bool)
+    possible[candidates] = True
+
+    if(criterion == "worst"):
+        order = np.lexsort((~possible, squares, largest))
+    else:
+        order = np.lexsort((~possible, largest, squares))
+
+    return int(order[0])
+
+
+class OpeningBook:
+
+    def __init__(self, guesses, first, patterns, children, word_digest, answers_digest, criterion):
+        """
+        --------------------------------------------------------
+        Creates an opening book: a decision tree with the guess
+        to play at every node and one edge for every pattern
+        that guess can get, leading to the next node. The edges
+        of a node are stored next to each other, so the tree is
+        four arrays. A dictionary from (node, pattern) to the
+        next node is built once, so each step of a lookup is
+        O(1).
+        Use: book = OpeningBook(guesses, first, patterns, children, word_digest, answers_digest, criterion)
+        --------------------------------------------------------
+        Parameters:
+            guesses - The guess id of each node, the root first
+                      (np.ndarray)
+            first - Where the edges of each node start, with
+                    one extra entry at the end (np.ndarray)
+            patterns - The pattern code of each edge
+                       (np.ndarray)
+            children - The node each edge leads to (np.ndarray)
+            word_digest - The digest of the word list (bytes)
+            answers_digest - The digest of the words that can
+                             be the answer (bytes)
+            criterion - How the guesses were chosen (str)
+        Returns:
+            A new OpeningBook object (OpeningBook)
+        --------------------------------------------------------
+        """
+        self.guesses = guesses
+        self.first = first
+        self.patterns = patterns
+        self.children = children
+        self.word_digest = word_digest
+        self.answers_digest = answers_digest
+        self.criterion = criterion
+
+        parents = np.repeat(np.arange(len(guesses), dtype=np.int64), np.diff(first))
+        keys = parents * PATTERN_COUNT + patterns
+        self._edges = dict(zip(keys.tolist(), children.tolist()))
+
+        return
+
+    def __len__(self):
+        """
+        --------------------------------------------------------
+        Returns the amount of nodes in the book.
+        Use: n = len(book)
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The amount of nodes (int)
+        --------------------------------------------------------
+        """
+        return len(self.guesses)
+
+    @classmethod
+    def build(cls, engine, matrix, opener, criterion="worst", depth=None):
+        """
+        --------------------------------------------------------
+        Builds the decision tree one level at a time, starting
+        from the opener and choosing every later guess with
+        best_guess. The candidates of engine (see
+        WordEngine.candidate_ids) are the possible answers, and
+        every word can be played as a guess. Word lists of
+        more than MAX_WORDS words are not supported.
+        Use: book = OpeningBook.build(engine, matrix, opener)
+        Use: book = OpeningBook.build(engine, matrix, opener, criterion, depth)
+        --------------------------------------------------------
+        Parameters:
+            engine - The words to use (WordEngine)
+            matrix - The guess by answer patterns
+                     (PatternMatrix or TiledMatrix)
+            opener - The id of the first guess (int)
+            criterion - "worst" or "expected" (str)
+            depth - The most guesses to store on a path, None
+                    for a full tree (int)
+        Returns:
+            A new OpeningBook object (OpeningBook)
+        --------------------------------------------------------
+        """
+        if(criterion not in CRITERIA):
+            raise ValueError("Unknown criterion: {:}".format(criterion))
+
+        if(len(engine) > MAX_WORDS):
+            raise ValueError("Opening books only hold word lists of up to {:,} words".format(MAX_WORDS))
+
+        guesses = []
+        edges = []
+        queue = deque([(engine.candidate_ids(), 1)])
+
+        while(queue):
+            candidates, level = queue.popleft()
+            node = len(guesses)
+            guess = opener if(node == 0) else best_guess(matrix, candidates, criterion)
+            guesses.append(guess)
+
+            if(depth is not None and level >= depth):
+                continue
+
+            codes = matrix[guess, candidates]
+
+            for code in np.unique(codes):
+                if(code != ALL_GREEN):
+                    edges.append((node, int(code), node + len(queue) + 1))
+                    queue.append((candidates[codes == code], level + 1))
+
+        edges = np.array(edges, dtype=np.int64).reshape(-1, 3)
+        first = np.searchsorted(edges[:, 0], np.arange(len(guesses) + 1)).astype(np.uint32)
+
+        return cls(np.array(guesses, dtype=np.uint16), first, edges[:, 1].astype(np.uint8),
+                   edges[:, 2].astype(np.uint32), engine.digest(), engine.answers_digest(), criterion)
+
+    @classmethod
+    def load(cls, filename, engine):
+        """
+        --------------------------------------------------------
+        Reads a book saved with save.
+        Use: book = OpeningBook.load(filename, engine)
+        --------------------------------------------------------
+        Parameters:
+            filename - The path of the book (str)
+            engine - The words the game is played with
+                     (WordEngine)
+        Returns:
+            The book, or None if it is missing or was built
+            from a different word list or answer list
+            (OpeningBook)
+        --------------------------------------------------------
+        """
+        if(not os.path.exists(filename) or os.path.getsize(filename) < _HEADER.itemsize):
+            return None
+
+        f = open(filename, "rb")
+        header = np.frombuffer(f.read(_HEADER.itemsize), dtype=_HEADER)[0]
+
+        if(header["magic"] != _MAGIC or header["version"] != _VERSION
+           or header["digest"].tobytes() != engine.digest()
+           or header["answers"].tobytes() != engine.answers_digest()):
+            f.close()
+            return None
+
+        nodes = int(header["nodes"])
+        count = int(header["edges"])
+        guesses = np.fromfile(f, dtype="<u2", count=nodes)
+        first = np.fromfile(f, dtype="<u4", count=nodes + 1)
+        patterns = np.fromfile(f, dtype=np.uint8, count=count)
+        children = np.fromfile(f, dtype="<u4", count=count)
+        f.close()
+
+        if(len(children) != count):
+            return None
+
+        return cls(guesses, first, patterns, children, engine.digest(), engine.answers_digest(),
+                   header["criterion"].decode("ascii"))
+
+    def save(self, filename):
+        """
+        --------------------------------------------------------
+        Writes the book to a file: a header followed by the
+        guess of each node (2 bytes), the first edge of each
+        node (4 bytes), and the pattern (1 byte) and next node
+        (4 bytes) of each edge.
+        Use: book.save(filename)
+        --------------------------------------------------------
+        Parameters:
+            filename - The path of the book (str)
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        header = np.zeros(1, dtype=_HEADER)
+        header[0] = (_MAGIC, _VERSION, np.frombuffer(self.word_digest, dtype=np.uint8),
+                     np.frombuffer(self.answers_digest, dtype=np.uint8), self.criterion.encode("ascii"), len(self.guesses), len(self.patterns))
+
+        temp = filename + ".tmp"
+        f = open(temp, "wb")
+        f.write(header.tobytes())
+        f.write(self.guesses.astype("<u2").tobytes())
+        f.write(self.first.astype("<u4").tobytes())
+        f.write(self.patterns.astype(np.uint8).tobytes())
+        f.write(self.children.astype("<u4").tobytes())
+        f.close()
+        os.replace(temp, filename)
+
+        return
+
+    def lookup(self, history):
+        """
+        --------------------------------------------------------
+        Follows the played guesses down the tree and returns
+        the guess stored for the state they lead to.
+        Use: guess = book.lookup(history)
+        --------------------------------------------------------
+        Parameters:
+            history - The (guess id, pattern code) pairs played
+                      so far (list)
+        Returns:
+            The id of the next guess, or None if the game has
+            left the book (int)
+        --------------------------------------------------------
+        """
+        node = 0
+
+        for guess, pattern in history:
+            if(int(self.guesses[node]) != guess):
+                return None
+
+            node = self._edges.get(node * PATTERN_COUNT + pattern)
+
+            if(node is None):
+                return None
+
+        return int(self.guesses[node])
+
+
+def main():
+    """
+    --------------------------------------------------------
+    Builds an opening book from the command line.
+    Use: python Book.py --opener salet --criterion worst
+    --------------------------------------------------------
+    Parameters:
+        None
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    parser = argparse.ArgumentParser(description="Builds a decision tree of guesses for every answer.")
+    parser.add_argument("--opener", help="first guess (default: the guess with the most information)")
+    parser.add_argument("--criterion", choices=CRITERIA, default="worst",
+                        help="keep the largest or the average group of remaining words small")
+    parser.add_argument("--depth", type=int, help="only store the first DEPTH guesses of each game")
+    parser.add_argument("--output", default=BOOK_FILE, help="where the book is written")
+    parser.add_argument("--memory", type=float, help="most megabytes of patterns to hold at once, "
+                                                     "computing them in tiles if the full matrix is larger")
+    parser.add_argument("--spill", help="file that keeps the computed tiles in tiled mode")
+    add_engine_arguments(parser)
+    args = parser.parse_args()
+
+    engine = load_engine(parser, args)
+
+    if(len(engine) > MAX_WORDS):
+        parser.error("Opening books only hold word lists of up to {:,} words".format(MAX_WORDS))
+
+    memory = None if(args.memory is None) else int(args.memory * 1024 * 1024)
+    matrix = load_matrix(engine, PATTERNS_FILE, memory, args.spill)
+
+    if(args.opener):
+        opener = engine.find(args.opener.lower())
+        if(opener < 0):
+            parser.error("{:} is not in the word list".format(args.opener))
+    else:
+        recommender = Recommender(matrix, 1)
+        opener = recommender.recommend(engine.candidate_ids(), 1)[0][0]
+
+    start = time.perf_counter()
+    book = OpeningBook.build(engine, matrix, opener, args.criterion, args.depth)
+    book.save(args.output)
+
+    print("Opener: {:}".format(engine.words[opener]))
+    print("Wrote {:} nodes to {:} ({:,} bytes, {:.1f} s)".format(len(book), args.output, os.path.getsize(args.output),
+                                                                    time.perf_counter() - start))
+
+
+if(__name__ == "__main__"):
+    main()
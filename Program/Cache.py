@@ -0,0 +1,251 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Cache.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+class FilterCache:
+
+    def __init__(self, max_entries=4096, max_bytes=32 * 1024 * 1024):
+        """
+        --------------------------------------------------------
+        Creates a cache from game states to the ids of the words
+        they allow and, once asked for, the recommended guesses.
+        States are keyed by their canonical constraints (see
+        Constraints.canonical), so every game that reaches the
+        same state shares one entry no matter which guesses led
+        there. The cache is kept in least recently used order
+        and the entries used longest ago are removed first when
+        it is over its limits. It can be shared by many games
+        and threads.
+        Use: cache = FilterCache()
+        Use: cache = FilterCache(max_entries, max_bytes)
+        --------------------------------------------------------
+        Parameters:
+            max_entries - The most states to keep (int)
+            max_bytes - The most memory the entries may use
+                        (int)
+        Returns:
+            A new FilterCache object (FilterCache)
+        --------------------------------------------------------
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.recommend_hits = 0
+        self.recommend_misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        return
+
+    def __len__(self):
+        """
+        --------------------------------------------------------
+        Returns the amount of states in the cache.
+        Use: n = len(cache)
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The amount of states (int)
+        --------------------------------------------------------
+        """
+        return len(self._entries)
+
+    def words(self, constraints, compute):
+        """
+        --------------------------------------------------------
+        Returns the ids of the words a state allows, calling
+        compute only if the state is not cached yet. The
+        returned array is shared, so it is read-only.
+        Use: ids = cache.words(constraints, compute)
+        --------------------------------------------------------
+        Parameters:
+            constraints - The state (Constraints)
+            compute - Returns the ids when the state is not
+                      cached (callable)
+        Returns:
+            The ids of the possible words (np.ndarray)
+        --------------------------------------------------------
+        """
+        key = constraints.canonical()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if(entry is not None):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+            self.misses += 1
+
+        words = compute()
+        words.flags.writeable = False
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            # Another thread may have filled the entry in the meantime
+            if(entry is not None):
+                return entry[0]
+
+            self._entries[key] = [words, None]
+            self._bytes += words.nbytes
+            self._shrink()
+
+        return words
+
+    def has_recommendations(self, constraints, k):
+        """
+        --------------------------------------------------------
+        Returns whether the k best guesses for a state are
+        cached, without counting a hit or a miss.
+        Use: cached = cache.has_recommendations(constraints, k)
+        --------------------------------------------------------
+        Parameters:
+            constraints - The state (Constraints)
+            k - The amount of guesses (int)
+        Returns:
+            True - The guesses are cached
+            False - They would have to be computed
+        --------------------------------------------------------
+        """
+        with self._lock:
+            entry = self._entries.get(constraints.canonical())
+
+            return entry is not None and self._covers(entry, k)
+
+    def _covers(self, entry, k):
+        """
+        --------------------------------------------------------
+        Returns whether an entry holds the k best guesses. Only
+        full rankings are stored, so a list shorter than the k
+        it was made for already holds every guess.
+        Use: covered = self._covers(entry, k)
+        --------------------------------------------------------
+        Parameters:
+            entry - An entry of the cache (list)
+            k - The amount of guesses (int)
+        Returns:
+            True - The entry holds the guesses
+            False - They would have to be computed
+        --------------------------------------------------------
+        """
+        return entry[1] is not None and (k <= entry[1][0] or len(entry[1][1]) < entry[1][0])
+
+    def recommendations(self, constraints, words, k, compute):
+        """
+        --------------------------------------------------------
+        Returns the k best guesses for a state, calling compute
+        only if fewer than k guesses are cached for it.
+        Use: best = cache.recommendations(constraints, words, k, compute)
+        --------------------------------------------------------
+        Parameters:
+            constraints - The state (Constraints)
+            words - The ids of the words the state allows, kept
+                    if the state is not cached yet (np.ndarray)
+            k - The amount of guesses (int)
+            compute - Returns the k best guesses when they are
+                      not cached (callable)
+        Returns:
+            A list of (guess, entropy) pairs, best first (list)
+        --------------------------------------------------------
+        """
+        key = constraints.canonical()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if(entry is not None and self._covers(entry, k)):
+                self._entries.move_to_end(key)
+                self.recommend_hits += 1
+                return entry[1][1][:k]
+
+            self.recommend_misses += 1
+
+        best = compute()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if(entry is None):
+                entry = [words, None]
+                self._entries[key] = entry
+                self._bytes += words.nbytes
+
+            self._entries.move_to_end(key)
+
+            if(entry[1] is None or entry[1][0] < k):
+                size = sys.getsizeof(best) + sum(sys.getsizeof(pair) for pair in best)
+                self._bytes += size - (0 if(entry[1] is None) else entry[1][2])
+                entry[1] = (k, best, size)
+                self._shrink()
+
+        return best
+
+    def clear(self):
+        """
+        --------------------------------------------------------
+        Removes every state. The counters are kept.
+        Use: cache.clear()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _shrink(self):
+        """
+        --------------------------------------------------------
+        Removes the least recently used states until the cache
+        is within its limits. The newest state is always kept.
+        The caller must hold the lock.
+        Use: self._shrink()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        while(len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes)):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry[0].nbytes + (0 if(entry[1] is None) else entry[1][2])
+            self.evictions += 1
+
+    def stats(self):
+        """
+        --------------------------------------------------------
+        Returns the counters of the cache.
+        Use: info = cache.stats()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The amount of states, their memory and the hit,
+            miss and eviction counts (dict)
+        --------------------------------------------------------
+        """
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes, "max_entries": self.max_entries,
+                    "max_bytes": self.max_bytes, "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions, "recommend_hits": self.recommend_hits,
+                    "recommend_misses": self.recommend_misses}
@@ -0,0 +1,190 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Check.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import argparse
+import sys
+import time
+import numpy as np
+from Constraints import Constraints
+from Engine import WORDS_FILE, WordEngine
+from Guesser import Guesser
+from Patterns import ALL_GREEN, PATTERN_COUNT, format_pattern, realizable, score
+from State import encode_state
+
+def check_feedback(engine, guesses):
+    """
+    --------------------------------------------------------
+    Compares the patterns of the vectorized kernel
+    (feedback_codes) with score for some guesses against
+    every word.
+    Use: wrong = check_feedback(engine, guesses)
+    --------------------------------------------------------
+    Parameters:
+        engine - The words (WordEngine)
+        guesses - The ids of the guesses to check (np.ndarray)
+    Returns:
+        The (guess, answer) pairs that differ (list)
+    --------------------------------------------------------
+    """
+    words = list(engine.words)
+    wrong = []
+
+    for guess_id in guesses:
+        guess = words[guess_id]
+        codes = engine.feedback(engine.all_ids(), guess)
+
+        for answer_id, code in enumerate(codes.tolist()):
+            if(code != score(guess, words[answer_id])):
+                wrong.append((guess, words[answer_id]))
+
+    return wrong
+
+
+def check_games(engine, games, rng):
+    """
+    --------------------------------------------------------
+    Plays random games and compares, after every guess, the
+    words that Constraints.apply and WordEngine.filter keep
+    with the words score gives the same patterns for.
+    Use: wrong = check_games(engine, games, rng)
+    --------------------------------------------------------
+    Parameters:
+        engine - The words (WordEngine)
+        games - The amount of games to play (int)
+        rng - Chooses the answers and the guesses
+              (np.random.Generator)
+    Returns:
+        The guesses of the games that differ, each with its
+        answer (list)
+    --------------------------------------------------------
+    """
+    words = list(engine.words)
+    wrong = []
+
+    for _ in range(games):
+        answer = words[rng.integers(len(words))]
+        constraints = Constraints()
+        expected = engine.all_ids()
+        played = []
+
+        while(len(played) < 6):
+            guess = words[rng.integers(len(words))]
+            code = score(guess, answer)
+            played.append(guess)
+            constraints = constraints.apply(guess, code)
+            expected = np.array([x for x in expected.tolist() if(score(guess, words[x]) == code)], dtype=np.int32)
+
+            if(not np.array_equal(engine.filter(engine.all_ids(), constraints), expected)):
+                wrong.append((answer, played))
+                break
+
+            if(code == ALL_GREEN):
+                break
+
+    return wrong
+
+
+def check_unrealizable(engine, guesses):
+    """
+    --------------------------------------------------------
+    Checks that patterns the game can not give are refused
+    both when they are played and when they are resumed from
+    a saved game, since their constraints match those of a
+    real pattern and would spoil a shared cache. Every
+    pattern score gives must be accepted.
+    Use: wrong = check_unrealizable(engine, guesses)
+    --------------------------------------------------------
+    Parameters:
+        engine - The words (WordEngine)
+        guesses - The ids of the guesses to check (np.ndarray)
+    Returns:
+        The (guess, pattern) pairs that were handled wrongly
+        (list)
+    --------------------------------------------------------
+    """
+    words = list(engine.words)
+    game = Guesser(engine)
+    wrong = []
+
+    for guess_id in guesses:
+        guess = words[guess_id]
+        given = set(score(guess, answer) for answer in words)
+
+        for code in range(PATTERN_COUNT):
+            if(realizable(guess, code)):
+                continue
+
+            if(code in given):
+                wrong.append((guess, format_pattern(code)))
+                continue
+
+            data = encode_state(Constraints().apply(guess, code), [(int(guess_id), code)], engine.digest())
+
+            for attempt in (lambda: game.apply_feedback(guess, code), lambda: Guesser.resume(data, engine)):
+                try:
+                    attempt()
+                    wrong.append((guess, format_pattern(code)))
+                except ValueError:
+                    pass
+
+            game.reset()
+
+    return wrong
+
+
+def main():
+    """
+    --------------------------------------------------------
+    Checks the fast ways of scoring and filtering against
+    score, the reference they are all built to agree with.
+    Use: python Check.py
+    Use: python Check.py --guesses 200 --games 500 --seed 1
+    --------------------------------------------------------
+    Parameters:
+        None
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    parser = argparse.ArgumentParser(description="Checks the pattern kernel and the filter against score.")
+    parser.add_argument("--guesses", type=int, default=50, help="amount of random guesses scored against every word")
+    parser.add_argument("--games", type=int, default=200, help="amount of random games filtered after every guess")
+    parser.add_argument("--seed", type=int, help="seed of the random guesses and answers")
+    args = parser.parse_args()
+
+    engine = WordEngine.load(WORDS_FILE)
+    rng = np.random.default_rng(args.seed)
+    start = time.perf_counter()
+
+    guesses = rng.choice(len(engine), min(args.guesses, len(engine)), replace=False)
+    feedback = check_feedback(engine, guesses)
+    games = check_games(engine, args.games, rng)
+    # Only a guess with a repeated letter has patterns the game can not give
+    repeated = [x for x, word in enumerate(engine.words) if(len(set(word)) < len(word))]
+    refused = check_unrealizable(engine, rng.choice(repeated, min(10, len(repeated)), replace=False))
+
+    for guess, answer in feedback[:10]:
+        print("Pattern of {:} against {:} differs from score".format(guess, answer))
+
+    for answer, played in games[:10]:
+        print("Filter differs from score for {:} after {:}".format(answer, ", ".join(played)))
+
+    for guess, pattern in refused[:10]:
+        print("Pattern {:} of {:} is not handled as the game would".format(pattern, guess))
+
+    print("{:,} patterns and {:,} games checked, {:,} wrong ({:.1f} s)".format(
+        len(guesses) * len(engine), args.games, len(feedback) + len(games) + len(refused), time.perf_counter() - start))
+
+    if(feedback or games or refused):
+        sys.exit(1)
+
+
+if(__name__ == "__main__"):
+    main()
@@ -0,0 +1,266 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Constraints.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+from Patterns import GRAY, GREEN, pattern_digits
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+WORD_LENGTH = 5
+ALL_LETTERS = (1 << len(ALPHABET)) - 1
+
+def bit(char):
+    """
+    --------------------------------------------------------
+    Returns the bit used for char in an allowed-letter mask.
+    Use: b = bit(char)
+    --------------------------------------------------------
+    Parameters:
+        char - A character from the alphabet (char)
+    Returns:
+        The bit of char (int)
+    --------------------------------------------------------
+    """
+    return 1 << (ord(char) - ord("a"))
+
+
+class Constraints:
+
+    __slots__ = ("allowed", "minimum", "maximum", "_hash")
+
+    def __init__(self, allowed=None, minimum=None, maximum=None):
+        """
+        --------------------------------------------------------
+        Creates a new Constraints object. allowed holds a 26 bit
+        mask of the possible letters at each position, and
+        minimum and maximum hold the min and max count of each
+        letter. With no arguments every letter is possible
+        everywhere. Constraints objects never change, so they
+        can be shared, hashed and used as dictionary keys.
+        Use: c = Constraints()
+        Use: c = Constraints(allowed, minimum, maximum)
+        --------------------------------------------------------
+        Parameters:
+            allowed - A mask for each position (int[5])
+            minimum - The min count of each letter (int[26])
+            maximum - The max count of each letter (int[26])
+        Returns:
+            A new Constraints object (Constraints)
+        --------------------------------------------------------
+        """
+        if(allowed is None):
+            allowed = (ALL_LETTERS,) * WORD_LENGTH
+        if(minimum is None):
+            minimum = (0,) * len(ALPHABET)
+        if(maximum is None):
+            maximum = (WORD_LENGTH,) * len(ALPHABET)
+
+        self.allowed = tuple(allowed)
+        self.minimum = tuple(minimum)
+        self.maximum = tuple(maximum)
+        self._hash = hash((self.allowed, self.minimum, self.maximum))
+
+        return
+
+    def __eq__(self, other):
+        """
+        --------------------------------------------------------
+        Compares two Constraints objects.
+        Use: c == other
+        --------------------------------------------------------
+        Parameters:
+            other - Another Constraints object (Constraints)
+        Returns:
+            True - Both objects hold the same constraints
+            False - The constraints are different
+        --------------------------------------------------------
+        """
+        if(not isinstance(other, Constraints)):
+            return NotImplemented
+
+        return (self._hash == other._hash and self.allowed == other.allowed
+                and self.minimum == other.minimum and self.maximum == other.maximum)
+
+    def __hash__(self):
+        """
+        --------------------------------------------------------
+        A Python magic method that allows Constraints to be
+        used in sets and as dictionary keys.
+        Use: hash(c)
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The hash of the constraints (int)
+        --------------------------------------------------------
+        """
+        return self._hash
+
+    def __copy__(self):
+        """
+        --------------------------------------------------------
+        Constraints never change, so a copy is the object
+        itself.
+        Use: copy(c)
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            This object (Constraints)
+        --------------------------------------------------------
+        """
+        return self
+
+    def __deepcopy__(self, memo):
+        """
+        --------------------------------------------------------
+        Constraints never change, so a deep copy is the object
+        itself.
+        Use: deepcopy(c)
+        --------------------------------------------------------
+        Parameters:
+            memo - The deepcopy memo (dict)
+        Returns:
+            This object (Constraints)
+        --------------------------------------------------------
+        """
+        return self
+
+    def __str__(self):
+        """
+        --------------------------------------------------------
+        Returns all the possible characters at each position.
+        Use: str(c)
+        Use: print(c)
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            One line per position (str)
+        --------------------------------------------------------
+        """
+        lines = []
+
+        for i in range(WORD_LENGTH):
+            lines.append("Character {:}: {:}".format(i + 1, self.possible(i)))
+
+        return "\n".join(lines)
+
+    def possible(self, i):
+        """
+        --------------------------------------------------------
+        Returns the possible characters at position i.
+        Use: chars = c.possible(i)
+        --------------------------------------------------------
+        Parameters:
+            i - The position (int)
+        Returns:
+            The possible characters in alphabetical order (str)
+        --------------------------------------------------------
+        """
+        mask = self.allowed[i]
+
+        return "".join(char for x, char in enumerate(ALPHABET) if(mask >> x & 1))
+
+    def apply(self, guess, code):
+        """
+        --------------------------------------------------------
+        Returns the constraints after a guess got a pattern.
+        Every position that is not green loses the letter of the
+        guess, and a green position keeps only its letter. A
+        letter that is green or yellow k times must appear at
+        least k times, and exactly k times if another copy of it
+        is gray. For a pattern the game can give (see
+        Patterns.realizable), these hold for exactly the words
+        that would give the same pattern.
+        Use: c = c.apply(guess, code)
+        --------------------------------------------------------
+        Parameters:
+            guess - The user's guess (str)
+            code - The pattern code of the guess (int)
+        Returns:
+            The new constraints (Constraints)
+        --------------------------------------------------------
+        """
+        allowed = list(self.allowed)
+        minimum = list(self.minimum)
+        maximum = list(self.maximum)
+        digits = pattern_digits(code)
+
+        for i, char in enumerate(guess):
+            if(digits[i] == GREEN):
+                allowed[i] &= bit(char)
+            else:
+                allowed[i] &= ~bit(char)
+
+        for char in set(guess):
+            x = ord(char) - ord("a")
+            marked = sum(1 for i in range(WORD_LENGTH) if(guess[i] == char and digits[i] != GRAY))
+
+            minimum[x] = max(minimum[x], marked)
+
+            # A gray copy means there are no more copies than the marked ones
+            if(marked < guess.count(char)):
+                maximum[x] = min(maximum[x], marked)
+
+            if(maximum[x] == 0):
+                for y in range(WORD_LENGTH):
+                    allowed[y] &= ~bit(char)
+
+        return Constraints(allowed, minimum, maximum)
+
+    def canonical(self):
+        """
+        --------------------------------------------------------
+        Returns the same constraints in a normal form, so two
+        states that allow exactly the same words through the
+        same rules compare equal however they were reached.
+        Every bound that follows from the others is tightened
+        until nothing changes: a letter can not appear more
+        often than the positions that allow it or than the room
+        the other letters leave, it appears at least as often
+        as the positions it is fixed at, and a letter that can
+        not appear is removed from every position.
+        Use: key = c.canonical()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The normalized constraints (Constraints)
+        --------------------------------------------------------
+        """
+        allowed = list(self.allowed)
+        minimum = list(self.minimum)
+        maximum = list(self.maximum)
+        changed = True
+
+        # Bounds only ever get tighter, so this ends after a few rounds
+        while(changed):
+            changed = False
+            slack = WORD_LENGTH - sum(minimum)
+
+            for x in range(len(ALPHABET)):
+                b = 1 << x
+                places = sum(1 for mask in allowed if(mask & b))
+                fixed = sum(1 for mask in allowed if(mask == b))
+                low = max(minimum[x], fixed)
+                high = max(min(maximum[x], places, minimum[x] + slack), 0)
+
+                if(low != minimum[x] or high != maximum[x]):
+                    minimum[x] = low
+                    maximum[x] = high
+                    changed = True
+
+                if(high == 0 and places):
+                    for y in range(WORD_LENGTH):
+                        allowed[y] &= ~b
+                    changed = True
+
+        canonical = Constraints(allowed, minimum, maximum)
+
+        return self if(canonical == self) else canonical
@@ -0,0 +1,191 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Dictionary.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import numpy as np
+
+from Packed import LETTER_BITS, WORD_LENGTH, decode, encode, letter_at, unpack
+
+WILDCARDS = "?_."
+
+class Dictionary:
+
+    __slots__ = ("_packed", "_valid")
+
+    def __init__(self, packed):
+        """
+        --------------------------------------------------------
+        Creates a new Dictionary of every word that can be
+        played. Unlike the possible words of a game, the
+        Dictionary never changes. Every word is kept as one
+        packed number (see Packed.py) in a sorted array, so
+        prefix lookups are binary searches and pattern lookups
+        test every word at once. Validity checks use a
+        frozenset, so they take the same time however many
+        words there are.
+        Use: d = Dictionary(engine.packed)
+        --------------------------------------------------------
+        Parameters:
+            packed - Every valid word, packed and sorted
+                     (np.ndarray)
+        Returns:
+            A new Dictionary object (Dictionary)
+        --------------------------------------------------------
+        """
+        self._packed = packed
+        text = (unpack(packed) + ord("a")).astype(np.uint8).tobytes().decode("ascii")
+        self._valid = frozenset(text[i:i + WORD_LENGTH] for i in range(0, len(text), WORD_LENGTH))
+
+        return
+
+    @classmethod
+    def from_words(cls, words):
+        """
+        --------------------------------------------------------
+        Creates a new Dictionary from a list of words. Words
+        that are not five letters from a to z are left out.
+        Use: d = Dictionary.from_words(words)
+        --------------------------------------------------------
+        Parameters:
+            words - Every valid word (iterable of str)
+        Returns:
+            A new Dictionary object (Dictionary)
+        --------------------------------------------------------
+        """
+        packed = np.fromiter((encode(word) for word in words), dtype=np.int64)
+        packed = np.unique(packed[packed >= 0]).astype(np.uint32)
+        packed.flags.writeable = False
+
+        return cls(packed)
+
+    def __contains__(self, word):
+        """
+        --------------------------------------------------------
+        A Python magic method that allows the use of the 'in'
+        operator
+        Use: word in d
+        --------------------------------------------------------
+        Parameters:
+            word - A word (str)
+        Returns:
+            True - word can be played
+            False - word is not in the dictionary
+        --------------------------------------------------------
+        """
+        return word in self._valid
+
+    def __len__(self):
+        """
+        --------------------------------------------------------
+        Returns the amount of words in the dictionary.
+        Use: n = len(d)
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The amount of words (int)
+        --------------------------------------------------------
+        """
+        return len(self._packed)
+
+    def _range(self, prefix):
+        """
+        --------------------------------------------------------
+        Returns the range of words that start with a prefix.
+        Because the first letter is kept in the highest bits,
+        those words are the packed numbers between the prefix
+        padded with the lowest letter and the next prefix.
+        Use: lo, hi = self._range(prefix)
+        --------------------------------------------------------
+        Parameters:
+            prefix - The start of a word (str)
+        Returns:
+            The first index and the index after the last word
+            with the prefix (tuple)
+        --------------------------------------------------------
+        """
+        value = encode(prefix.ljust(WORD_LENGTH, "a")) if(len(prefix) <= WORD_LENGTH) else -1
+
+        if(value < 0):
+            return 0, 0
+
+        shift = LETTER_BITS * (WORD_LENGTH - len(prefix))
+        low = value >> shift << shift
+        start, end = np.searchsorted(self._packed, [low, low + (1 << shift)])
+
+        return int(start), int(end)
+
+    def complete(self, prefix, limit=None):
+        """
+        --------------------------------------------------------
+        Returns the words that start with prefix, in
+        alphabetical order.
+        Use: words = d.complete(prefix)
+        Use: words = d.complete(prefix, limit)
+        --------------------------------------------------------
+        Parameters:
+            prefix - The start of a word (str)
+            limit - The most words to return (int)
+        Returns:
+            The matching words (str[])
+        --------------------------------------------------------
+        """
+        start, end = self._range(prefix.lower())
+
+        if(limit is not None):
+            end = min(end, start + limit)
+
+        return [decode(value) for value in self._packed[start:end]]
+
+    def match(self, pattern, limit=None):
+        """
+        --------------------------------------------------------
+        Returns the words that fit a pattern, where '?', '_' or
+        '.' stands for any letter. The letters before the first
+        wildcard narrow the search to one range of words, and
+        the rest of the letters are tested on the whole range
+        at once.
+        Use: words = d.match("c?a?e")
+        Use: words = d.match(pattern, limit)
+        --------------------------------------------------------
+        Parameters:
+            pattern - Letters and wildcards (str)
+            limit - The most words to return (int)
+        Returns:
+            The matching words, in alphabetical order (str[])
+        --------------------------------------------------------
+        """
+        pattern = pattern.lower()
+
+        if(len(pattern) != WORD_LENGTH):
+            return []
+
+        fixed = len(pattern)
+
+        for x, char in enumerate(pattern):
+            if(char in WILDCARDS):
+                fixed = x
+                break
+
+        start, end = self._range(pattern[:fixed])
+        packed = self._packed[start:end]
+        keep = np.ones(len(packed), dtype=bool)
+
+        for x in range(fixed, WORD_LENGTH):
+            char = pattern[x]
+
+            if(char in WILDCARDS):
+                continue
+
+            if(not "a" <= char <= "z"):
+                return []
+
+            keep &= letter_at(packed, x) == ord(char) - ord("a")
+
+        return [decode(value) for value in packed[keep][:limit]]
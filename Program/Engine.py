@@ -0,0 +1,511 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Engine.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import hashlib
+import os
+import numpy as np
+from Index import WordIndex
+from Packed import decode, encode, letter_counts, pack, unpack
+from Patterns import feedback_codes
+from Snapshot import build_snapshot, digest, encode_words, open_snapshot, snapshot_name
+from Weights import load_weights, weights_name
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+WORD_LENGTH = 5
+WORDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words.txt")
+ANSWERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "answers.txt")
+CANDIDATES = ("answers", "all")
+
+class WordList:
+
+    __slots__ = ("_packed",)
+
+    def __init__(self, packed):
+        """
+        --------------------------------------------------------
+        Creates a read-only list of words on top of an array of
+        packed words (see Packed.py). A word is only turned into
+        a string when it is looked up.
+        Use: words = WordList(packed)
+        --------------------------------------------------------
+        Parameters:
+            packed - The packed words (np.ndarray)
+        Returns:
+            A new WordList object (WordList)
+        --------------------------------------------------------
+        """
+        self._packed = packed
+        return
+
+    def __len__(self):
+        """
+        --------------------------------------------------------
+        Returns the amount of words.
+        Use: n = len(words)
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The amount of words (int)
+        --------------------------------------------------------
+        """
+        return len(self._packed)
+
+    def __getitem__(self, i):
+        """
+        --------------------------------------------------------
+        A Python magic method that allows you to treat WordList
+        like a list structure.
+        Use: word = words[i]
+        --------------------------------------------------------
+        Parameters:
+            i - The id of the word (int)
+        Returns:
+            The word (str)
+        --------------------------------------------------------
+        """
+        return decode(self._packed[i])
+
+    def __iter__(self):
+        """
+        --------------------------------------------------------
+        A Python magic method that allows you to iterate through
+        the words in order.
+        Use: for word in words
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            yields every word (str)
+        --------------------------------------------------------
+        """
+        text = (unpack(self._packed) + ord("a")).astype(np.uint8).tobytes().decode("ascii")
+
+        for i in range(0, len(text), WORD_LENGTH):
+            yield text[i:i + WORD_LENGTH]
+
+
+class WordEngine:
+
+    def __init__(self, packed, word_digest=None):
+        """
+        --------------------------------------------------------
+        Creates a new WordEngine from the sorted packed words
+        (see Packed.py). The (N, 5) letter codes the patterns
+        are computed from and an (N, 26) array holding how many
+        times each letter appears in each word are built from
+        them.
+        Use: e = WordEngine(packed)
+        Use: e = WordEngine(packed, word_digest)
+        --------------------------------------------------------
+        Parameters:
+            packed - The sorted packed words, which can be
+                     memory-mapped (np.ndarray)
+            word_digest - The digest of the letter codes, if it
+                          is already known (bytes)
+        Returns:
+            A new WordEngine object (WordEngine)
+        --------------------------------------------------------
+        """
+        # Every word as one 25 bit number in alphabetical order, so a word can be found with a binary search
+        self.packed = packed
+        self.packed.flags.writeable = False
+        self.codes = unpack(packed)
+        self.codes.flags.writeable = False
+        self.words = WordList(self.packed)
+        self._digest = word_digest
+        # The prior weight of every word (see Weights.py), or None if every word is as likely
+        self.weights = None
+        # The ids of the words that can be the answer (see use_answers), or None if every word can
+        self.answers = None
+
+        self.counts = letter_counts(self.codes)
+        self.index = WordIndex(self.codes, self.counts)
+        self._all_ids = np.arange(len(packed), dtype=np.int32)
+        self._all_ids.flags.writeable = False
+
+        return
+
+    @classmethod
+    def from_words(cls, words):
+        """
+        --------------------------------------------------------
+        Creates a new WordEngine from a list of five letter
+        words.
+        Use: e = WordEngine.from_words(words)
+        --------------------------------------------------------
+        Parameters:
+            words - A list of five letter words (str[])
+        Returns:
+            A new WordEngine object (WordEngine)
+        --------------------------------------------------------
+        """
+        return cls(pack(encode_words(words)))
+
+    @classmethod
+    def from_file(cls, filename):
+        """
+        --------------------------------------------------------
+        Creates a new WordEngine from a comma separated file of
+        words.
+        Use: e = WordEngine.from_file(filename)
+        --------------------------------------------------------
+        Parameters:
+            filename - The path to the word list (str)
+        Returns:
+            A new WordEngine object (WordEngine)
+        --------------------------------------------------------
+        """
+        f = open(filename, "r")
+        words = f.read().split(",")
+        f.close()
+
+        return cls.from_words(words)
+
+    @classmethod
+    def load(cls, filename=WORDS_FILE):
+        """
+        --------------------------------------------------------
+        Creates a new WordEngine from the snapshot of a word
+        list (see Snapshot.py). The snapshot is memory-mapped,
+        so the words are never split or sorted again. If the
+        snapshot is missing or older than the word list, it is
+        built first. If it can not be written, the word list is
+        read directly. If a weights file for the word list
+        exists (see Weights.py), it is loaded as well.
+        Use: e = WordEngine.load()
+        Use: e = WordEngine.load(filename)
+        --------------------------------------------------------
+        Parameters:
+            filename - The path to the word list (str)
+        Returns:
+            A new WordEngine object (WordEngine)
+        --------------------------------------------------------
+        """
+        snapshot = snapshot_name(filename)
+        opened = open_snapshot(snapshot, filename)
+
+        if(opened is None):
+            try:
+                build_snapshot(filename, snapshot)
+                opened = open_snapshot(snapshot, filename)
+            except OSError:
+                pass
+
+        engine = cls.from_file(filename) if(opened is None) else cls(*opened)
+        engine.weights = load_weights(weights_name(filename), engine)
+
+        return engine
+
+    def __len__(self):
+        """
+        --------------------------------------------------------
+        Returns the amount of words in the engine.
+        Use: n = len(e)
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The amount of words (int)
+        --------------------------------------------------------
+        """
+        return len(self.codes)
+
+    def all_ids(self):
+        """
+        --------------------------------------------------------
+        Returns the ids of every word in the engine. The same
+        read-only array is returned every time.
+        Use: ids = e.all_ids()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            An array of word ids (np.ndarray)
+        --------------------------------------------------------
+        """
+        return self._all_ids
+
+    def candidate_ids(self):
+        """
+        --------------------------------------------------------
+        Returns the ids of the words that can be the answer: the
+        answer list if one is used, otherwise every word. Games
+        start from these words, while every word can still be
+        played as a guess.
+        Use: ids = e.candidate_ids()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            An array of word ids (np.ndarray)
+        --------------------------------------------------------
+        """
+        return self._all_ids if(self.answers is None) else self.answers
+
+    def use_answers(self, words):
+        """
+        --------------------------------------------------------
+        Limits the words that can be the answer to a smaller
+        list, such as the answers of the game without the words
+        that are only allowed as guesses. None makes every word
+        possible again.
+        Use: n = e.use_answers(words)
+        --------------------------------------------------------
+        Parameters:
+            words - The words that can be the answer, each of
+                    them in the word list (iterable of str)
+        Returns:
+            The amount of possible answers (int)
+        --------------------------------------------------------
+        """
+        if(words is None):
+            self.answers = None
+            return len(self)
+
+        self.answers = np.unique(self.find_all(words))
+        self.answers.flags.writeable = False
+
+        return len(self.answers)
+
+    def load_answers(self, filename=ANSWERS_FILE):
+        """
+        --------------------------------------------------------
+        Reads a comma or line separated file of answers and
+        limits the words that can be the answer to them (see
+        use_answers).
+        Use: n = e.load_answers()
+        Use: n = e.load_answers(filename)
+        --------------------------------------------------------
+        Parameters:
+            filename - The path to the answer list (str)
+        Returns:
+            The amount of possible answers (int)
+        --------------------------------------------------------
+        """
+        return self.use_answers(read_words(filename))
+
+    def find_all(self, words):
+        """
+        --------------------------------------------------------
+        Finds the ids of a list of words, in the same order.
+        Spaces around the words and their case are ignored and
+        empty entries are skipped. Every word must be in the
+        word list, otherwise a ValueError naming the missing
+        words is raised.
+        Use: ids = e.find_all(words)
+        --------------------------------------------------------
+        Parameters:
+            words - The words to find (iterable of str)
+        Returns:
+            The ids of the words (np.ndarray)
+        --------------------------------------------------------
+        """
+        words = [word.strip().lower() for word in words if(word.strip())]
+        ids = np.array([self.find(word) for word in words], dtype=np.int32)
+        missing = [word for word, i in zip(words, ids) if(i < 0)]
+
+        if(missing):
+            raise ValueError("Not in the word list: {:}".format(", ".join(missing)))
+
+        return ids
+
+    def answers_digest(self):
+        """
+        --------------------------------------------------------
+        Returns a hash of the words that can be the answer, so
+        files that depend on them (such as opening books) can
+        tell which answers they were built for.
+        Use: d = e.answers_digest()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The SHA-256 digest of the answer ids, or 32 zero
+            bytes if every word can be the answer (bytes)
+        --------------------------------------------------------
+        """
+        if(self.answers is None):
+            return bytes(32)
+
+        return hashlib.sha256(self.answers.astype("<i4").tobytes()).digest()
+
+    def digest(self):
+        """
+        --------------------------------------------------------
+        Returns a hash of the word list. Files built from the
+        words (such as cached patterns) store it so they can
+        tell when the word list has changed.
+        Use: d = e.digest()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The SHA-256 digest of the sorted word list (bytes)
+        --------------------------------------------------------
+        """
+        if(self._digest is None):
+            self._digest = digest(self.codes)
+
+        return self._digest
+
+    def find(self, word):
+        """
+        --------------------------------------------------------
+        Finds the id of word.
+        Use: i = e.find(word)
+        --------------------------------------------------------
+        Parameters:
+            word - A five letter word (str)
+        Returns:
+            The id of the word, or -1 if it does not exist (int)
+        --------------------------------------------------------
+        """
+        key = encode(word)
+
+        if(key < 0):
+            return -1
+
+        i = int(np.searchsorted(self.packed, key))
+
+        if(i < len(self.packed) and self.packed[i] == key):
+            return i
+
+        return -1
+
+    def feedback(self, ids, guess):
+        """
+        --------------------------------------------------------
+        Computes the pattern a guess gets against some words.
+        The guess does not have to be in the word list.
+        Use: codes = e.feedback(ids, guess)
+        --------------------------------------------------------
+        Parameters:
+            ids - The ids of the answers (np.ndarray)
+            guess - A five letter word (str)
+        Returns:
+            The pattern code for each answer (np.ndarray)
+        --------------------------------------------------------
+        """
+        guess_codes = np.frombuffer(guess.lower().encode("ascii"), dtype=np.uint8)[None, :] - ord("a")
+
+        return feedback_codes(guess_codes, self.codes[ids], self.counts[ids])[0]
+
+    def matching(self, ids, guess, code):
+        """
+        --------------------------------------------------------
+        Keeps the words that would give exactly the pattern
+        code for guess. This is the exact filter: a word stays
+        if and only if score(guess, word) == code.
+        Use: ids = e.matching(ids, guess, code)
+        --------------------------------------------------------
+        Parameters:
+            ids - The ids of the words to check (np.ndarray)
+            guess - A five letter word (str)
+            code - The pattern code of the guess (int)
+        Returns:
+            The ids of the words that match (np.ndarray)
+        --------------------------------------------------------
+        """
+        return ids[self.feedback(ids, guess) == code]
+
+    def filter(self, ids, constraints):
+        """
+        --------------------------------------------------------
+        Keeps the words whose letters are allowed at every
+        position and whose letter counts are between the min
+        and the max counts.
+        Use: ids = e.filter(ids, constraints)
+        --------------------------------------------------------
+        Parameters:
+            ids - The ids of the words to check (np.ndarray)
+            constraints - The allowed letters and letter counts
+                          (Constraints)
+        Returns:
+            The ids of the words that meet the requirements
+            (np.ndarray)
+        --------------------------------------------------------
+        """
+        # Anything that is not in the possible characters
+        bits = self.index.allowed(constraints.allowed)
+
+        # Anything that is above the max or below the min
+        if(bits):
+            bits &= self.index.counted(constraints.minimum, constraints.maximum)
+
+        if(bits == self.index.everything):
+            return ids
+
+        return self.index.to_ids(bits & self.index.from_ids(ids))
+
+
+def read_words(filename):
+    """
+    --------------------------------------------------------
+    Reads a file of words separated by commas or new lines.
+    Use: words = read_words(filename)
+    --------------------------------------------------------
+    Parameters:
+        filename - The path of the file (str)
+    Returns:
+        The entries of the file, not yet stripped (str[])
+    --------------------------------------------------------
+    """
+    f = open(filename, "r")
+    words = f.read().replace("\n", ",").split(",")
+    f.close()
+
+    return words
+
+
+def add_engine_arguments(parser):
+    """
+    --------------------------------------------------------
+    Adds the options that choose which words can be the
+    answer to a command line parser.
+    Use: add_engine_arguments(parser)
+    --------------------------------------------------------
+    Parameters:
+        parser - The parser of a program (argparse.ArgumentParser)
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    parser.add_argument("--candidates", choices=CANDIDATES, default="answers",
+                        help="track only the words of the answer list as possible answers, or every word")
+    parser.add_argument("--answers", default=ANSWERS_FILE, help="comma separated file of the possible answers")
+
+
+def load_engine(parser, args):
+    """
+    --------------------------------------------------------
+    Loads the word list and, unless every word can be the
+    answer, the answer list chosen on the command line (see
+    add_engine_arguments). A missing or wrong answer list
+    ends the program with an error message.
+    Use: engine = load_engine(parser, args)
+    --------------------------------------------------------
+    Parameters:
+        parser - The parser of the program
+                 (argparse.ArgumentParser)
+        args - The parsed arguments (argparse.Namespace)
+    Returns:
+        The words to use (WordEngine)
+    --------------------------------------------------------
+    """
+    engine = WordEngine.load(WORDS_FILE)
+
+    if(args.candidates == "answers"):
+        try:
+            engine.load_answers(args.answers)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+
+    return engine
@@ -8,341 +8,604 @@ Date:       February 26, 2022
 --------------------------------------------------------
 """
 
-from copy import deepcopy
-from Characters import Letters
-from Counts import LetterCount
+import argparse
+import sys
+import numpy as np
+from Book import BOOK_FILE, OpeningBook
+from Constraints import Constraints
+from Dictionary import WILDCARDS, Dictionary
+from Engine import WORDS_FILE, WordEngine, add_engine_arguments, load_engine
+from History import History, Turn
+from Patterns import PATTERN_COUNT, PATTERNS_FILE, format_pattern, load_matrix, parse_pattern, realizable
+from Recommender import Recommender, Search, entropies
+from State import MAX_WORDS, decode_state, encode_state
+from Output import MODES, WordWriter
+
+try:
+    import readline
+except ImportError:
+    readline = None
 
 ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+RECOMMENDATIONS = 10
+GUESSES = 6
+COMPLETIONS = 50
 
 class Guesser:
 
-    def __init__(self):
+    __slots__ = ("_engine", "_dictionary", "_recommender", "_owns_recommender", "_book", "_cache", "_history",
+                 "_background")
+
+    def __init__(self, engine=None, recommender=None, dictionary=None, book=None, cache=None):
         """
         --------------------------------------------------------
-        Initializes the Guesser object
+        Initializes the Guesser object. Creating a Guesser has
+        no side effects apart from reading the word lists when
+        no engine is given. Many Guesser objects can share one
+        engine, one recommender, one dictionary, one opening
+        book and one cache.
         Use: g = Guesser()
+        Use: g = Guesser(engine, recommender, dictionary, book, cache)
         --------------------------------------------------------
         Parameters:
-            None
+            engine - The words to use, defaults to the words in
+                     words.txt with the words in answers.txt as
+                     the possible answers, like the command line
+                     (WordEngine)
+            recommender - Ranks the next guesses. If None, one is
+                          created the first time it is needed
+                          (Recommender)
+            dictionary - The words that can be played, defaults
+                         to every word in engine (Dictionary)
+            book - The guesses to play in the opening, if any
+                   (OpeningBook)
+            cache - Remembers the possible words and the
+                    recommendations of states other games have
+                    reached, if any (FilterCache)
         Returns:
             A new Guesser object (Guesser)
         --------------------------------------------------------
         """
-        f = open("words.txt", "r")
+        if(engine is None):
+            engine = WordEngine.load(WORDS_FILE)
+            engine.load_answers()
+
+        if(dictionary is None):
+            dictionary = Dictionary(engine.packed)
+
+        self._engine = engine
+        self._dictionary = dictionary
+        self._recommender = recommender
+        self._owns_recommender = recommender is None
+        self._book = book
+        self._cache = cache
+        self._history = History(Turn(Constraints(), engine.candidate_ids()))
+        self._background = None
 
-        self._possible_chars = []
-        temp = []
+        return
 
-        for x in ALPHABET:
-            temp.append(x)
+    def __len__(self):
+        """
+        --------------------------------------------------------
+        Returns the amount of possible words left.
+        Use: n = len(g)
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The amount of possible words (int)
+        --------------------------------------------------------
+        """
+        return len(self._history.current().words)
 
-        for x in range(5):
-            self._possible_chars.append(deepcopy(temp))
+    def nbytes(self):
+        """
+        --------------------------------------------------------
+        Returns roughly how much memory this game uses on top of
+        the shared engine, dictionary and recommender.
+        Use: n = g.nbytes()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The size in bytes (int)
+        --------------------------------------------------------
+        """
+        return sys.getsizeof(self) + self._history.nbytes()
 
-        self._remaining_letters = Letters()
-        self._yellows = []
-        self._words = f.read().split(",")
-        self._words.sort()
-        self._print_words(True)
+    def reset(self):
+        """
+        --------------------------------------------------------
+        Starts a new game with every answer possible again. The
+        first turn is kept, so nothing is filtered again.
+        Use: g.reset()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        self._cancel()
+        self._history.restart()
 
-        f.close()
-        return
+    def undo(self):
+        """
+        --------------------------------------------------------
+        Takes back the latest guess, for example when its
+        colours were typed in wrong.
+        Use: undone = g.undo()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The guess that was taken back, or None if no guess
+            has been played (str)
+        --------------------------------------------------------
+        """
+        turn = self._history.undo()
 
-    def _search(self, guess):
+        if(turn is None):
+            return None
+
+        self._cancel()
+
+        return turn.guess
+
+    def guesses(self):
         """
         --------------------------------------------------------
-        Goes through each word and the word gets removed if the
-        requirements are not met. 
-        Use: self._search(guess)
+        Returns the guesses played so far with their pattern
+        codes.
+        Use: played = g.guesses()
         --------------------------------------------------------
         Parameters:
-            guess - The user's guess is a five letter word (str)
+            None
+        Returns:
+            A list of (guess, pattern code) pairs, oldest first
+            (list)
+        --------------------------------------------------------
+        """
+        return [(turn.guess, turn.pattern) for turn in self._history]
+
+    def apply_feedback(self, guess, pattern):
+        """
+        --------------------------------------------------------
+        Removes the words that do not match the feedback of a
+        guess. With a cache, a state another game has already
+        reached is not filtered again.
+        Use: n = g.apply_feedback("raise", "bgbyb")
+        Use: n = g.apply_feedback(guess, code)
+        --------------------------------------------------------
+        Parameters:
+            guess - The guess that was played (str)
+            pattern - The colours of the guess, as a string of
+                      'g', 'y' and 'b' or '-' or as a pattern
+                      code (str or int)
         Returns:
+            The amount of possible words left (int)
+        --------------------------------------------------------
+        """
+        guess = guess.lower()
+
+        if(guess not in self._dictionary):
+            raise ValueError("Word not in the word list: {:}".format(guess))
+
+        code = parse_pattern(pattern)
+
+        # Such a pattern shares its constraints with a real one, so it must not reach the cache
+        if(not realizable(guess, code)):
+            raise ValueError("The game can not give {:} the pattern {:}".format(guess, format_pattern(code)))
+
+        current = self._history.current()
+        constraints = current.constraints.apply(guess, code)
+
+        # The words only depend on the constraints, so they can be shared under them
+        if(self._cache is None):
+            words = self._engine.filter(current.words, constraints)
+        else:
+            words = self._cache.words(constraints, lambda: self._engine.filter(current.words, constraints))
+
+        self._cancel()
+        self._history.push(Turn(constraints, words, guess, code))
+
+        return len(words)
+
+    def save(self):
+        """
+        --------------------------------------------------------
+        Saves the game as a small fixed size record (see
+        State.py), so it can be written to disk and resumed
+        later with Guesser.resume. Games played with more than
+        State.MAX_WORDS words can not be saved.
+        Use: data = g.save()
+        --------------------------------------------------------
+        Parameters:
             None
+        Returns:
+            The saved game (bytes)
         --------------------------------------------------------
         """
+        if(len(self._engine) > MAX_WORDS):
+            raise ValueError("Saved games only hold word lists of up to {:,} words".format(MAX_WORDS))
 
-        green_chars = ""
-        yellow_chars = ""
-        
-        # User inputs for green and yellow characters. The loops only break if the user's input is valid.
-        while(True):
-            valid = False
-            green_chars = input("Please type your guess again, but replace gray and yellow characters with '-': ")
+        guesses = [(self._engine.find(turn.guess), turn.pattern) for turn in self._history]
 
-            if(len(green_chars) == 5):
-                for i in range(5):
-                    if(green_chars[i] != guess[i] and green_chars[i] != '-'):
-                        break
-                    elif(i == 4):
-                        valid = True
+        return encode_state(self._history.current().constraints, guesses, self._engine.digest())
 
-            if(valid):
-                break
+    @classmethod
+    def resume(cls, data, engine=None, recommender=None, dictionary=None, book=None, cache=None):
+        """
+        --------------------------------------------------------
+        Creates a Guesser from a game saved with save. Only the
+        constraints of each turn are rebuilt; the possible
+        words of a turn are filtered the first time they are
+        used.
+        Use: g = Guesser.resume(data)
+        Use: g = Guesser.resume(data, engine, recommender, dictionary, book, cache)
+        --------------------------------------------------------
+        Parameters:
+            data - The saved game (bytes)
+            engine - The words the game was played with
+                     (WordEngine)
+            recommender - Ranks the next guesses (Recommender)
+            dictionary - The words that can be played
+                         (Dictionary)
+            book - The guesses to play in the opening
+                   (OpeningBook)
+            cache - Remembers the possible words and the
+                    recommendations of states (FilterCache)
+        Returns:
+            A new Guesser object (Guesser)
+        --------------------------------------------------------
+        """
+        game = cls(engine, recommender, dictionary, book, cache)
+        constraints, guesses = decode_state(data, game._engine.digest())
+        turn = game._history.current()
 
-            print("Invalid input, please try again.")
+        for word_id, code in guesses:
+            if(not 0 <= word_id < len(game._engine) or code >= PATTERN_COUNT):
+                raise ValueError("Not a saved game")
 
-        while(True):
-            valid = False
-            yellow_chars = input("Please type your guess again, but replace gray and green characters with '-': ")
+            guess = game._engine.words[word_id]
 
-            if(len(yellow_chars) == 5):
-                for i in range(5):
-                    if(yellow_chars[i] != guess[i] and yellow_chars[i] != '-'):
-                        break
-                    elif(i == 4):
-                        valid = True
+            # Like apply_feedback, a pattern the game can not give must never reach the cache
+            if(not realizable(guess, code)):
+                raise ValueError("Not a saved game")
 
-            if(valid):
-                break
+            turn = Turn.lazy(turn.constraints.apply(guess, code), turn, game._engine, guess, code)
+            game._history.push(turn)
 
-            print("Invalid input, please try again.")
+        if(turn.constraints != constraints):
+            raise ValueError("The saved constraints do not match the saved guesses")
 
+        return game
+
+    def _feedback(self, guess):
+        """
+        --------------------------------------------------------
+        Computes the pattern a guess would get against every
+        possible word. The guess must be in the dictionary,
+        otherwise a ValueError is raised.
+        Use: codes = self._feedback(guess)
+        --------------------------------------------------------
+        Parameters:
+            guess - A word that can be played (str)
+        Returns:
+            The pattern code for each possible word (np.ndarray)
+        --------------------------------------------------------
+        """
         guess = guess.lower()
-        green_chars = green_chars.lower()
-        yellow_chars = yellow_chars.lower()   
-
-        self._search_greens(green_chars)
-        self._search_yellows(yellow_chars)
-        self._search_grays(guess, green_chars, yellow_chars)
-        self._update_counts(guess, green_chars, yellow_chars)
-
-
-        i = 0
-        length = len(self._words)
-
-        while(i < length):
-            popped = False
-            # Anything that is not in the possible characters
-            for x in range(5):
-                if(self._words[i][x] not in self._possible_chars[x]):
-                    popped = True
-                    self._words.pop(i)
-                    length -= 1
-                    break
-            
-            if(not popped):
-                # Anything that is above the max or below the min
-                counts = LetterCount()
-                counts.add_word(self._words[i])
-                letter_count = counts.get_letters()
-
-                for char in letter_count:
-
-                    curr_char_count = counts.get_count(char.char())
-                    minimum = self._remaining_letters.get_min(char.char())
-                    maximum = self._remaining_letters.get_max(char.char())
-
-                    if((curr_char_count > maximum) or (curr_char_count < minimum)):
-                        popped = True
-                        self._words.pop(i)
-                        length -= 1
-                        break
 
-            if(not popped):
-                i += 1
+        if(guess not in self._dictionary):
+            raise ValueError("Word not in the word list: {:}".format(guess))
+
+        return self._engine.feedback(self._history.current().words, guess)
 
-    
-    def _search_greens(self, greens):
+    def what_if(self, guess, patterns=None):
         """
         --------------------------------------------------------
-        Goes through [greens]. Set self._possible_chars where
-        the green characters are to only the green character at
-        that index.
-        Use: self._search_greens(greens)
+        Returns how many words would be left if guess got the
+        given feedback, without playing the guess. The pattern
+        of the guess against every possible word is computed
+        once, so asking about every pattern costs the same as
+        asking about one.
+        Use: counts = g.what_if(guess)
+        Use: n = g.what_if(guess, "gybbg")
+        Use: counts = g.what_if(guess, [code1, code2])
         --------------------------------------------------------
         Parameters:
-            greens - A 5 character string (str)
+            guess - A word that can be played (str)
+            patterns - A pattern, a list of patterns, or None for
+                       every pattern (str, int, list or None)
         Returns:
-            None
+            The amount of words left for the pattern (int), for
+            each pattern in the list (int[]), or an array
+            indexed by pattern code when patterns is None
+            (np.ndarray)
         --------------------------------------------------------
         """
+        counts = np.bincount(self._feedback(guess), minlength=PATTERN_COUNT)
 
-        # Check the green characters
-        for i, g_char in enumerate(greens):
-            if(g_char.isalpha()):
-                self._possible_chars[i] = [g_char]
+        if(patterns is None):
+            return counts
 
+        if(isinstance(patterns, (str, int, np.integer))):
+            return int(counts[parse_pattern(patterns)])
 
+        return [int(counts[parse_pattern(pattern)]) for pattern in patterns]
 
-    
-    def _search_yellows(self, yellows):
+    def what_if_words(self, guess, patterns=None):
         """
         --------------------------------------------------------
-        Goes through [yellows]. Remove letters from
-        self._possible_chars where the yellow characters are.
-        Use: 
+        Returns the words that would be left if guess got the
+        given feedback, without playing the guess. Every
+        pattern is answered from one sort of the possible words
+        by their pattern.
+        Use: groups = g.what_if_words(guess)
+        Use: words = g.what_if_words(guess, "gybbg")
         --------------------------------------------------------
         Parameters:
-            yellows - A 5 character string (str)
+            guess - A word that can be played (str)
+            patterns - A pattern, a list of patterns, or None for
+                       every pattern (str, int, list or None)
         Returns:
-            None
+            The words left for the pattern (str[]), or a
+            dictionary from pattern string to the words left,
+            with only the patterns that leave a word when
+            patterns is None (list or dict)
         --------------------------------------------------------
         """
+        codes = self._feedback(guess)
+        words = self._history.current().words
+        order = words[np.argsort(codes, kind="stable")]
+        ends = np.cumsum(np.bincount(codes, minlength=PATTERN_COUNT))
+        starts = ends - np.bincount(codes, minlength=PATTERN_COUNT)
 
-        self._yellows = []
+        def group(code):
+            return [self._engine.words[x] for x in order[starts[code]:ends[code]]]
 
-        # Check the yellow characters
-        for i, y_char in enumerate(yellows):
-            if(y_char.isalpha()):
-                self._yellows.append(y_char)
-                
-                temp = self._possible_chars[i]
-                self._possible_chars[i] = []
+        if(patterns is None):
+            return {format_pattern(code): group(code) for code in np.unique(codes)}
 
-                for x in ALPHABET:
-                    if(x != y_char and x in temp):
-                        self._possible_chars[i].append(x)
-
-            
+        if(isinstance(patterns, (str, int, np.integer))):
+            return group(parse_pattern(patterns))
 
+        return {format_pattern(parse_pattern(pattern)): group(parse_pattern(pattern)) for pattern in patterns}
 
-    def _search_grays(self, guess, greens, yellows):
+    def candidates(self, offset=0, limit=None):
         """
         --------------------------------------------------------
-        Removes all characters that are not in greens or
-        yellows. Also removes gray characters that exist in 
-        greens.
-        Use: self._search_grays(guess, greens, yellows)
+        Goes through the possible words in alphabetical order,
+        or from the most to the least likely if the engine has
+        prior weights. Only the words that are asked for are
+        turned back into strings, so a page of a long list is
+        cheap.
+        Use: for word in g.candidates()
+        Use: for word in g.candidates(offset, limit)
         --------------------------------------------------------
         Parameters:
-            guess - The user's guess (str)
-            greens - A 5 character string with confirmed
-                     characters (str)
-            yellows - A 5 character string where characters
-                      exist in the actual word (str)
+            offset - The amount of words to skip (int)
+            limit - The most words to return (int)
         Returns:
+            yields the possible words (str)
+        --------------------------------------------------------
+        """
+        words = self._history.current().words
+        stop = None if(limit is None) else offset + limit
+
+        if(self._engine.weights is not None):
+            words = words[np.argsort(-self._engine.weights[words], kind="stable")]
+
+        for word_id in words[offset:stop]:
+            yield self._engine.words[word_id]
+
+    def _book_guess(self):
+        """
+        --------------------------------------------------------
+        Looks up the current state in the opening book.
+        Use: guess = self._book_guess()
+        --------------------------------------------------------
+        Parameters:
             None
+        Returns:
+            The id of the book guess, or None if there is no
+            book or the game has left it (int)
         --------------------------------------------------------
         """
+        if(self._book is None):
+            return None
 
-        grays = ""
+        return self._book.lookup([(self._engine.find(turn.guess), turn.pattern) for turn in self._history])
 
-        for i, char in enumerate(guess):
-            if((char == greens[i]) or (char == yellows[i])):
-                grays += '-'
-            else:
-                grays += char
+    def recommend(self, k=10):
+        """
+        --------------------------------------------------------
+        Returns the guesses that give the most information about
+        the possible words. While the game follows the opening
+        book, the book's guess is returned on its own without
+        any search. The pattern matrix and the worker processes
+        are only created the first time a search is needed, and
+        with a cache a state is only searched once. If prepare
+        has started a search for this state, its result is
+        used.
+        Use: best = g.recommend()
+        Use: best = g.recommend(k)
+        --------------------------------------------------------
+        Parameters:
+            k - The amount of guesses to return (int)
+        Returns:
+            A list of (guess, entropy) pairs, best first (list)
+        --------------------------------------------------------
+        """
+        guess = self._book_guess()
+
+        if(guess is not None):
+            word = self._engine.words[guess]
+            return [(word, float(entropies(self._feedback(word)[None, :])[0]))]
 
-        for i, char in enumerate(grays):
+        if(self._recommender is None):
+            self._recommender = Recommender(load_matrix(self._engine, PATTERNS_FILE), weights=self._engine.weights)
 
-            if(char != '-'):
-                for y in range(5):
+        current = self._history.current()
+        search = self._current_search()
 
-                    """
-                    The following needs to be satisfied to be popped from the possible character list:
-                    - The character exists in the list
-                    - The length of the list does not equal 1
-                    """
-                    if(char in self._possible_chars[y] and len(self._possible_chars[y]) != 1):
+        def compute():
+            # A cancelled search only ranked part of the guesses
+            if(search is not None and k <= search.k):
+                search.wait()
+                if(search.complete()):
+                    return search.best(k)
 
-                        if(char not in greens and char not in yellows):
-                            self._possible_chars[y].pop(self._possible_chars[y].index(char))
-                        elif(char != greens[y] and char in greens and char not in yellows):
-                            self._possible_chars[y].pop(self._possible_chars[y].index(char))
-                
-                if(char in yellows):
-                    self._possible_chars[i].pop(self._possible_chars[i].index(char))
+            return self._recommender.recommend(current.words, k)
 
-    def _update_counts(self, guess, greens, yellows):
+        if(self._cache is None):
+            best = compute()
+        else:
+            best = self._cache.recommendations(current.constraints, current.words, k, compute)
+
+        return [(self._engine.words[word_id], bits) for word_id, bits in best]
+
+    def prepare(self, k=RECOMMENDATIONS):
         """
         --------------------------------------------------------
-        Updates the min and max counts of each letter.
-        Use: self._update_counts(guess, greens, yellows)
+        Starts working out the recommendations for the current
+        state in a background thread, so recommend can answer
+        at once when it is asked later. Nothing is started
+        while the game follows the opening book, when a single
+        word is left, or before the recommender is created. The
+        search is cancelled by the next guess, undo or reset.
+        Use: g.prepare()
+        Use: g.prepare(k)
         --------------------------------------------------------
         Parameters:
-            guess - The user's guess (str)
-            greens - A 5 character string with confirmed
-                     characters (str)
-            yellows - A 5 character string where characters
-                      exist in the actual word (str)
+            k - The amount of guesses to work out (int)
         Returns:
             None
         --------------------------------------------------------
         """
+        self._cancel()
+        current = self._history.current()
 
-        grays = ""
-        num_of_grays = 0
-        inside_words = ""           # Greens and yellows together
-        counts = LetterCount()
-        yellow_count = LetterCount()
+        if(self._recommender is None or len(current.words) <= 1 or self._book_guess() is not None):
+            return
 
-        for i, char in enumerate(guess):
-            if((char == greens[i]) or (char == yellows[i])):
-                grays += '-'
-            else:
-                grays += char
-                num_of_grays += 1
+        if(self._cache is not None and self._cache.has_recommendations(current.constraints, k)):
+            return
 
-        for g_char in greens:
-            if(g_char.isalpha()):
-                inside_words += g_char
+        self._background = (current, Search(self._recommender, current.words, k))
 
-        for y_char in yellows:
-            if(y_char.isalpha()):
-                inside_words += y_char
-                yellow_count.add(y_char)
+    def _current_search(self):
+        """
+        --------------------------------------------------------
+        Returns the background search of the current state.
+        Use: search = self._current_search()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The search, or None if there is none for the
+            current state (Search)
+        --------------------------------------------------------
+        """
+        if(self._background is None or self._background[0] is not self._history.current()):
+            return None
 
-        counts.add_word(inside_words)
+        return self._background[1]
 
-        for i, char in enumerate(ALPHABET):
+    def _cancel(self):
+        """
+        --------------------------------------------------------
+        Cancels the background search, if there is one.
+        Use: self._cancel()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        if(self._background is not None):
+            self._background[1].cancel()
+            self._background = None
 
-            # Characters not in the guess will have a max of [num_of_grays] possible characters
-            if(char not in guess):
-                if(self._remaining_letters.get_max(char) > 0):
-                    self._remaining_letters.set_max_letter(char, num_of_grays)
-            else:
-                # The purely gray characters will be set to 0
-                if(char not in greens and char not in yellows):
-                    self._remaining_letters.set_max_letter(char, 0)
-                else:
-                    # Adjust min amount of characters
-                    if(self._remaining_letters.get_min(char) < counts.get_count(char)):
-                        self._remaining_letters.set_min_letter(char, counts.get_count(char))
-
-                    # Adjust max amount of characters to amount inside the word.
-                    if(char in inside_words and char in grays):
-                        self._remaining_letters.set_max_letter(char, counts.get_count(char))
-                    else:
-                        self._remaining_letters.set_max_letter(char, 5 - counts.get_count_except(char))
-
-                    if(char in yellows and char in greens and char not in grays):
-                        self._remaining_letters.set_max_letter(char, 5 - yellow_count.get_count(char))
-                    elif(char in yellows and char not in greens and char not in grays):
-                        self._remaining_letters.set_max_letter(char, 5 - counts.get_count(char))
-                    elif(char in yellows and char not in greens and char in grays):
-                        self._remaining_letters.set_max_letter(char, counts.get_count(char))
-                      
-    def _print_words(self, write_to_file):
-        """
-        --------------------------------------------------------
-        Writes all the possible words to a .txt file along
-        with the amount of words.
-        Use: self._print_words(write_to_file)
-        Use: print(self._print_words(write_to_file))
+    def _search(self, guess):
+        """
+        --------------------------------------------------------
+        Asks for the colours of a guess and removes the words
+        that do not match them.
+        Use: self._search(guess)
         --------------------------------------------------------
         Parameters:
-            write_to_file - If True, write the possible words to
-                            a .txt file. If false, just return
-                            the output (boolean)
+            guess - The user's guess is a five letter word (str)
         Returns:
-            All possible remaining words (str)
+            None
         --------------------------------------------------------
         """
-        output = "{:} Possible Words\n".format(len(self._words))
-        output += ("=" * 152) + "\n"
 
-        for i, word in enumerate(self._words):
-            output += word + "  "
-            if((i + 1) % 22 == 0):
-                output += "\n"
+        # One line with the colours of every letter. An empty line falls back to typing the guess twice.
+        while(True):
+            colours = input("Please type the colours of your guess ('g' green, 'y' yellow, 'b' or '-' gray), or press Enter to type the guess again: ")
+
+            if(not colours):
+                break
+
+            try:
+                self.apply_feedback(guess, parse_pattern(colours))
+                return
+            except ValueError:
+                print("Invalid input, please try again.")
+
+        green_chars = ""
+        yellow_chars = ""
         
-        if(write_to_file):
-            f = open("possible_words.txt", "w")
-            f.write(output)
-            f.close()
+        # User inputs for green and yellow characters. The loops only break if the user's input is valid.
+        while(True):
+            valid = False
+            green_chars = input("Please type your guess again, but replace gray and yellow characters with '-': ")
 
-        return output
+            if(len(green_chars) == 5):
+                for i in range(5):
+                    if(green_chars[i] != guess[i] and green_chars[i] != '-'):
+                        break
+                    elif(i == 4):
+                        valid = True
+
+            if(valid):
+                break
+
+            print("Invalid input, please try again.")
+
+        while(True):
+            valid = False
+            yellow_chars = input("Please type your guess again, but replace gray and green characters with '-': ")
+
+            if(len(yellow_chars) == 5):
+                for i in range(5):
+                    if(yellow_chars[i] != guess[i] and yellow_chars[i] != '-'):
+                        break
+                    elif(i == 4):
+                        valid = True
+
+            if(valid):
+                break
+
+            print("Invalid input, please try again.")
+
+        pattern = ""
+
+        for green, yellow in zip(green_chars, yellow_chars):
+            if(green.isalpha()):
+                pattern += "g"
+            elif(yellow.isalpha()):
+                pattern += "y"
+            else:
+                pattern += "b"
+
+        try:
+            self.apply_feedback(guess, pattern)
+        except ValueError as e:
+            print("{:}, please type the guess again.".format(e))
 
     def _print_possibilities(self):
         """
@@ -356,18 +619,86 @@ class Guesser:
             None
         --------------------------------------------------------
         """
-        for i, x in enumerate(self._possible_chars):
-            possibilities = ""
-            for y in x:
-                possibilities += y
-            print("Character {:}: {:}".format(i + 1, possibilities))
+        print(self._history.current().constraints)
 
-    def play(self):
+    def _print_recommendations(self):
         """
         --------------------------------------------------------
-        The main function. Allows the user to guess words and
-        get possible words.
-        Use: g.play()
+        Prints the guesses that give the most information about
+        the remaining words. If a background search is still
+        running, it is waited for, or its best guesses so far
+        are shown if the wait is interrupted.
+        Use: self._print_recommendations()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        if(self._recommender is None and self._book_guess() is None):
+            print("Loading the pattern matrix, the first run can take a minute...")
+
+        search = self._current_search()
+
+        if(search is not None and not search.done()):
+            print("Finishing the search ({:.0%} done), Ctrl-C shows the best so far...".format(search.progress()))
+
+        try:
+            best = self.recommend(RECOMMENDATIONS)
+        except KeyboardInterrupt:
+            if(search is None):
+                raise
+            self._cancel()
+            best = [(self._engine.words[word_id], bits) for word_id, bits in search.best()]
+            print("Best of the {:.0%} of guesses scored so far:".format(search.progress()))
+
+        largest = {} if(search is None) else search.largest
+
+        for i, (word, bits) in enumerate(best):
+            line = "{:>2}. {:}  {:.3f} bits".format(i + 1, word, bits)
+            word_id = self._engine.find(word)
+            if(word_id in largest):
+                line += ", at most {:} left".format(largest[word_id])
+            print(line)
+
+        if(self._book_guess() is None and len(self) > 1):
+            scored, total = self._recommender.pool if(search is None) else search.pool
+            print("Scored {:,} different guesses out of {:,}; the other {:,} were equivalent or gave no information."
+                  .format(scored, total, total - scored))
+
+    def _complete(self, text, state):
+        """
+        --------------------------------------------------------
+        Completes a word when Tab is pressed. Text with '?', '_'
+        or '.' in it is treated as a pattern, anything else as
+        the start of a word.
+        Use: readline.set_completer(self._complete)
+        --------------------------------------------------------
+        Parameters:
+            text - What the user has typed so far (str)
+            state - Which match to return (int)
+        Returns:
+            The match, or None when there are no more (str)
+        --------------------------------------------------------
+        """
+        if(any(char in WILDCARDS for char in text)):
+            matches = self._dictionary.match(text, COMPLETIONS)
+        else:
+            matches = self._dictionary.complete(text, COMPLETIONS)
+
+        if(state < len(matches)):
+            return matches[state]
+
+        return None
+
+    def close(self):
+        """
+        --------------------------------------------------------
+        Shuts down the worker processes used for
+        recommendations, unless the recommender was given to
+        this Guesser by the caller.
+        Use: g.close()
         --------------------------------------------------------
         Parameters:
             None
@@ -375,40 +706,131 @@ class Guesser:
             None
         --------------------------------------------------------
         """
+        self._cancel()
 
-        guesses = 6
+        if(self._recommender is not None and self._owns_recommender):
+            self._recommender.close()
 
-        while(guesses > 0):
+    def play(self, writer=None):
+        """
+        --------------------------------------------------------
+        The interactive game. Allows the user to guess words
+        and get possible words. After every change to the
+        possible words the next recommendations are worked out
+        in the background while the user decides (see
+        prepare).
+        Use: g.play()
+        Use: g.play(writer)
+        --------------------------------------------------------
+        Parameters:
+            writer - Shows and saves the possible words, defaults
+                     to every word in possible_words.txt
+                     (WordWriter)
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        if(writer is None):
+            writer = WordWriter()
+
+        if(readline is not None):
+            readline.set_completer(self._complete)
+            # The wildcards are part of a pattern, so they must not split the text that is completed
+            delimiters = readline.get_completer_delims()
+            readline.set_completer_delims("".join(char for char in delimiters if(char not in WILDCARDS)))
+            readline.parse_and_bind("tab: complete")
+
+        writer.write(len(self), self.candidates())
+        self.prepare()
+
+        while(len(self._history) < GUESSES):
             print("=================================================")
-            print("{:} guesses remaining".format(guesses))      
-            user = input("Functions:\nS: Stops the game\nP: Prints the possible words\nR: Restarts the game\nC: All possible characters\nPlease enter a word: ")
+            print("{:} guesses remaining".format(GUESSES - len(self._history)))
+            user = input("Functions:\nS: Stops the game\nP: Prints the possible words\nR: Restarts the game\nU: Undoes the last guess\nC: All possible characters\nH: Recommends the next guess\nPlease enter a word: ")
 
             if(user == "S"):
                 break
             elif(user == "P"):
                 print()
-                print(self._print_words(False))
+                writer.show(len(self), self.candidates())
                 print()
             elif(user == "R"):
-                self.__init__()
-                guesses = 6
+                self.reset()
+                writer.write(len(self), self.candidates())
+                self.prepare()
+            elif(user == "U"):
+                undone = self.undo()
+                if(undone is None):
+                    print("There is no guess to undo.")
+                else:
+                    print("Took back {:}.".format(undone))
+                    writer.write(len(self), self.candidates())
+                    self.prepare()
             elif(user == "C"):
                 self._print_possibilities()
+            elif(user == "H"):
+                self._print_recommendations()
             else:
                 user = user.lower()
                 if(len(user) > 5):
                     print("Word is too long, please try again.")
                 elif(len(user) < 5):
                     print("Word is too short, please try again")
-                elif(user not in self._words):
+                elif(user not in self._dictionary):
                     print("Word not available, please try again.")
                 else:
-                    guesses -= 1
                     self._search(user)
-                    self._print_words(True)
+                    writer.write(len(self), self.candidates())
+                    self.prepare()
             
             print("=================================================")
 
-            
-game = Guesser()
-game.play()
+        self.close()
+
+
+def main():
+    """
+    --------------------------------------------------------
+    Starts the interactive game from the command line.
+    Use: python Guesser.py
+    Use: python Guesser.py --show top --top 50
+    --------------------------------------------------------
+    Parameters:
+        None
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    parser = argparse.ArgumentParser(description="Finds the possible Wordle answers.")
+    parser.add_argument("--show", choices=MODES, default="full",
+                        help="how the possible words are shown (off also stops writing the file)")
+    parser.add_argument("--top", type=int, default=100, help="amount of words shown in top mode")
+    parser.add_argument("--page-rows", type=int, default=20, help="rows per page in page mode")
+    parser.add_argument("--file", default="possible_words.txt", help="where the possible words are written")
+    parser.add_argument("--book", default=BOOK_FILE, help="opening book to use if it exists (see Book.py)")
+    parser.add_argument("--memory", type=float, help="most megabytes of patterns to hold at once, "
+                                                     "computing them in tiles if the full matrix is larger")
+    parser.add_argument("--no-background", action="store_true",
+                        help="only search for recommendations when asked, and load the patterns then")
+    add_engine_arguments(parser)
+    args = parser.parse_args()
+
+    engine = load_engine(parser, args)
+    recommender = None
+
+    # The background search needs the patterns from the start
+    if(args.memory is not None or not args.no_background):
+        memory = None if(args.memory is None) else int(args.memory * 1024 * 1024)
+        print("Loading the pattern matrix, the first run can take a minute...")
+        recommender = Recommender(load_matrix(engine, PATTERNS_FILE, memory), weights=engine.weights)
+
+    game = Guesser(engine, recommender, book=OpeningBook.load(args.book, engine))
+    game.play(WordWriter(args.file, args.show, args.top, args.page_rows))
+
+    if(recommender is not None):
+        recommender.close()
+
+
+if(__name__ == "__main__"):
+    main()
+
@@ -0,0 +1,248 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  History.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import sys
+
+class Turn:
+
+    __slots__ = ("constraints", "guess", "pattern", "_words", "_parent", "_engine")
+
+    def __init__(self, constraints, words, guess=None, pattern=None):
+        """
+        --------------------------------------------------------
+        Creates the state of a game after a turn. A Turn never
+        changes, so going back to an earlier turn only means
+        using the earlier object again. The word ids are made
+        read-only so they can be shared between turns and
+        games.
+        Use: t = Turn(constraints, words)
+        Use: t = Turn(constraints, words, guess, pattern)
+        --------------------------------------------------------
+        Parameters:
+            constraints - The allowed letters and letter counts
+                          (Constraints)
+            words - The ids of the possible words (np.ndarray)
+            guess - The guess played on this turn, None for the
+                    start of a game (str)
+            pattern - The pattern code of the guess (int)
+        Returns:
+            A new Turn object (Turn)
+        --------------------------------------------------------
+        """
+        if(words is not None):
+            words.flags.writeable = False
+
+        object.__setattr__(self, "constraints", constraints)
+        object.__setattr__(self, "guess", guess)
+        object.__setattr__(self, "pattern", pattern)
+        object.__setattr__(self, "_words", words)
+        object.__setattr__(self, "_parent", None)
+        object.__setattr__(self, "_engine", None)
+
+        return
+
+    @classmethod
+    def lazy(cls, constraints, parent, engine, guess, pattern):
+        """
+        --------------------------------------------------------
+        Creates a Turn whose words are only filtered the first
+        time they are used, by scoring the guess against the
+        words of the turn before it. This is how a saved game is resumed without
+        filtering every turn up front.
+        Use: t = Turn.lazy(constraints, parent, engine, guess, pattern)
+        --------------------------------------------------------
+        Parameters:
+            constraints - The allowed letters and letter counts
+                          (Constraints)
+            parent - The turn before this one (Turn)
+            engine - The words to filter (WordEngine)
+            guess - The guess played on this turn (str)
+            pattern - The pattern code of the guess (int)
+        Returns:
+            A new Turn object (Turn)
+        --------------------------------------------------------
+        """
+        turn = cls(constraints, None, guess, pattern)
+        object.__setattr__(turn, "_parent", parent)
+        object.__setattr__(turn, "_engine", engine)
+
+        return turn
+
+    @property
+    def words(self):
+        """
+        --------------------------------------------------------
+        Returns the read-only ids of the possible words.
+        Use: ids = t.words
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The ids of the possible words (np.ndarray)
+        --------------------------------------------------------
+        """
+        if(self._words is None):
+            words = self._engine.matching(self._parent.words, self.guess, self.pattern)
+            words.flags.writeable = False
+            object.__setattr__(self, "_words", words)
+            object.__setattr__(self, "_parent", None)
+            object.__setattr__(self, "_engine", None)
+
+        return self._words
+
+    def __setattr__(self, name, value):
+        """
+        --------------------------------------------------------
+        Stops a Turn from being changed.
+        Use: t.words = words
+        --------------------------------------------------------
+        Parameters:
+            name - The name of the attribute (str)
+            value - The new value (object)
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        raise AttributeError("Turn objects can not be changed")
+
+
+class History:
+
+    __slots__ = ("_turns",)
+
+    def __init__(self, start):
+        """
+        --------------------------------------------------------
+        Creates a stack of turns, starting with the state of a
+        new game.
+        Use: h = History(start)
+        --------------------------------------------------------
+        Parameters:
+            start - The state before the first guess (Turn)
+        Returns:
+            A new History object (History)
+        --------------------------------------------------------
+        """
+        self._turns = [start]
+        return
+
+    def __len__(self):
+        """
+        --------------------------------------------------------
+        Returns the amount of guesses played.
+        Use: n = len(h)
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The amount of guesses (int)
+        --------------------------------------------------------
+        """
+        return len(self._turns) - 1
+
+    def __iter__(self):
+        """
+        --------------------------------------------------------
+        A Python magic method that allows you to iterate through
+        the turns that had a guess, oldest first.
+        Use: for turn in h
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            yields every played turn (Turn)
+        --------------------------------------------------------
+        """
+        for turn in self._turns[1:]:
+            yield turn
+
+    def nbytes(self):
+        """
+        --------------------------------------------------------
+        Returns roughly how much memory the stack uses. The first
+        turn is not counted because its words are shared by
+        every game, and words that have not been filtered yet
+        are not counted either.
+        Use: n = h.nbytes()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The size in bytes (int)
+        --------------------------------------------------------
+        """
+        size = sys.getsizeof(self._turns)
+
+        for turn in self._turns[1:]:
+            size += sys.getsizeof(turn)
+            if(turn._words is not None):
+                size += turn._words.nbytes
+
+        return size
+
+    def current(self):
+        """
+        --------------------------------------------------------
+        Returns the latest turn.
+        Use: t = h.current()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The latest turn (Turn)
+        --------------------------------------------------------
+        """
+        return self._turns[-1]
+
+    def push(self, turn):
+        """
+        --------------------------------------------------------
+        Adds a turn to the top of the stack.
+        Use: h.push(turn)
+        --------------------------------------------------------
+        Parameters:
+            turn - The state after a guess (Turn)
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        self._turns.append(turn)
+
+    def undo(self):
+        """
+        --------------------------------------------------------
+        Removes the latest guess.
+        Use: undone = h.undo()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The turn that was removed, or None if no guess has
+            been played (Turn)
+        --------------------------------------------------------
+        """
+        if(len(self._turns) == 1):
+            return None
+
+        return self._turns.pop()
+
+    def restart(self):
+        """
+        --------------------------------------------------------
+        Goes back to the state before the first guess.
+        Use: h.restart()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        del self._turns[1:]
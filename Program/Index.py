@@ -0,0 +1,198 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Index.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import numpy as np
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+class WordIndex:
+
+    def __init__(self, codes, counts):
+        """
+        --------------------------------------------------------
+        Creates an index of the words. For every position and
+        letter it holds a bitset (a Python int) where bit i is
+        set if word i has that letter at that position, and for
+        every letter and count from 0 to 5 a bitset of the words
+        with exactly that many copies of the letter. A set of
+        words can then be filtered with a few whole-set AND and
+        OR operations instead of looking at each word.
+        Use: index = WordIndex(codes, counts)
+        --------------------------------------------------------
+        Parameters:
+            codes - An (N, 5) array of letter codes (np.ndarray)
+            counts - An (N, 26) array of letter counts
+                     (np.ndarray)
+        Returns:
+            A new WordIndex object (WordIndex)
+        --------------------------------------------------------
+        """
+        self.size = len(codes)
+        self.length = codes.shape[1]
+        self.everything = (1 << self.size) - 1
+        self.positions = []
+        self.counts = []
+
+        for x in range(self.length):
+            column = np.asarray(codes[:, x])
+            self.positions.append([self.from_mask(column == letter) for letter in range(len(ALPHABET))])
+
+        for letter in range(len(ALPHABET)):
+            column = np.asarray(counts[:, letter])
+            self.counts.append([self.from_mask(column == amount) for amount in range(self.length + 1)])
+
+        return
+
+    def from_mask(self, mask):
+        """
+        --------------------------------------------------------
+        Turns a boolean array into a bitset.
+        Use: bits = index.from_mask(mask)
+        --------------------------------------------------------
+        Parameters:
+            mask - One boolean per word (np.ndarray)
+        Returns:
+            The bitset (int)
+        --------------------------------------------------------
+        """
+        return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+    def from_ids(self, ids):
+        """
+        --------------------------------------------------------
+        Turns an array of word ids into a bitset.
+        Use: bits = index.from_ids(ids)
+        --------------------------------------------------------
+        Parameters:
+            ids - The ids of the words (np.ndarray)
+        Returns:
+            The bitset (int)
+        --------------------------------------------------------
+        """
+        if(len(ids) == self.size):
+            return self.everything
+
+        mask = np.zeros(self.size, dtype=bool)
+        mask[ids] = True
+
+        return self.from_mask(mask)
+
+    def to_ids(self, bits):
+        """
+        --------------------------------------------------------
+        Turns a bitset back into an array of word ids.
+        Use: ids = index.to_ids(bits)
+        --------------------------------------------------------
+        Parameters:
+            bits - The bitset (int)
+        Returns:
+            The ids of the words, smallest first (np.ndarray)
+        --------------------------------------------------------
+        """
+        data = np.frombuffer(bits.to_bytes((self.size + 7) // 8, "little"), dtype=np.uint8)
+        mask = np.unpackbits(data, count=self.size, bitorder="little")
+
+        return np.flatnonzero(mask).astype(np.int32)
+
+    def allowed(self, masks):
+        """
+        --------------------------------------------------------
+        Returns the words that only use allowed letters. Each
+        position ORs the bitsets of its allowed letters (or of
+        its removed letters, when there are fewer of those) and
+        the positions are ANDed together. Positions where every
+        letter is allowed are skipped.
+        Use: bits = index.allowed(masks)
+        --------------------------------------------------------
+        Parameters:
+            masks - A 26 bit mask of the allowed letters at
+                    each position (int[])
+        Returns:
+            The bitset of the words that fit (int)
+        --------------------------------------------------------
+        """
+        full = (1 << len(ALPHABET)) - 1
+        bits = self.everything
+
+        for x, mask in enumerate(masks):
+            if(mask == full):
+                continue
+
+            removed = mask.bit_count() > len(ALPHABET) // 2
+
+            if(removed):
+                mask ^= full
+
+            position = 0
+            letters = self.positions[x]
+
+            while(mask):
+                letter = (mask & -mask).bit_length() - 1
+                position |= letters[letter]
+                mask &= mask - 1
+
+            if(removed):
+                bits &= ~position
+            else:
+                bits &= position
+
+            if(not bits):
+                break
+
+        return bits
+
+    def bounded(self, letter, minimum, maximum):
+        """
+        --------------------------------------------------------
+        Returns the words with between minimum and maximum
+        copies of a letter, as the union of the exact count
+        bitsets in that range.
+        Use: bits = index.bounded(letter, minimum, maximum)
+        --------------------------------------------------------
+        Parameters:
+            letter - The letter code (0 - 25) (int)
+            minimum - The min count of the letter (int)
+            maximum - The max count of the letter (int)
+        Returns:
+            The bitset of the words that fit (int)
+        --------------------------------------------------------
+        """
+        bits = 0
+
+        for amount in range(max(minimum, 0), min(maximum, self.length) + 1):
+            bits |= self.counts[letter][amount]
+
+        return bits
+
+    def counted(self, minimum, maximum):
+        """
+        --------------------------------------------------------
+        Returns the words whose letter counts are all between
+        the min and max counts. Letters that allow every count
+        are skipped.
+        Use: bits = index.counted(minimum, maximum)
+        --------------------------------------------------------
+        Parameters:
+            minimum - The min count of each letter (int[26])
+            maximum - The max count of each letter (int[26])
+        Returns:
+            The bitset of the words that fit (int)
+        --------------------------------------------------------
+        """
+        bits = self.everything
+
+        for letter in range(len(ALPHABET)):
+            if(minimum[letter] > 0 or maximum[letter] < self.length):
+                bits &= self.bounded(letter, minimum[letter], maximum[letter])
+
+                if(not bits):
+                    break
+
+        return bits
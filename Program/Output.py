@@ -0,0 +1,175 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Output.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+from itertools import islice
+
+WORDS_PER_ROW = 22
+ROWS_PER_CHUNK = 64
+MODES = ("full", "top", "page", "off")
+
+class WordWriter:
+
+    def __init__(self, filename="possible_words.txt", mode="full", limit=100, page_rows=20):
+        """
+        --------------------------------------------------------
+        Creates a new WordWriter, which shows the possible words
+        on screen and writes them to a .txt file.
+        mode chooses how much is shown:
+            full - every word, 22 words per row
+            top - only the first [limit] words
+            page - every word, [page_rows] rows at a time
+            off - only the amount of words, and nothing is
+                  written to the file
+        Use: w = WordWriter()
+        Use: w = WordWriter(filename, mode, limit, page_rows)
+        --------------------------------------------------------
+        Parameters:
+            filename - The .txt file to write to, or None to
+                       never write a file (str)
+            mode - One of MODES (str)
+            limit - The amount of words in top mode (int)
+            page_rows - The amount of rows per page in page
+                        mode (int)
+        Returns:
+            A new WordWriter object (WordWriter)
+        --------------------------------------------------------
+        """
+        if(mode not in MODES):
+            raise ValueError("Invalid output mode: {:}".format(mode))
+
+        self.filename = filename
+        self.mode = mode
+        self.limit = limit
+        self.page_rows = page_rows
+
+        return
+
+    def _header(self, count):
+        """
+        --------------------------------------------------------
+        Returns the header above the list of words.
+        Use: text = self._header(count)
+        --------------------------------------------------------
+        Parameters:
+            count - The amount of possible words (int)
+        Returns:
+            The header (str)
+        --------------------------------------------------------
+        """
+        return "{:} Possible Words\n".format(count) + ("=" * 152) + "\n"
+
+    def rows(self, words):
+        """
+        --------------------------------------------------------
+        Goes through the words one row at a time. Every word is
+        followed by two spaces and every full row ends with a
+        new line.
+        Use: for row in w.rows(words)
+        --------------------------------------------------------
+        Parameters:
+            words - The words to format (iterable of str)
+        Returns:
+            yields one row of words (str)
+        --------------------------------------------------------
+        """
+        words = iter(words)
+        row = list(islice(words, WORDS_PER_ROW))
+
+        while(row):
+            text = "  ".join(row) + "  "
+
+            if(len(row) == WORDS_PER_ROW):
+                text += "\n"
+
+            yield text
+            row = list(islice(words, WORDS_PER_ROW))
+
+    def format(self, count, words):
+        """
+        --------------------------------------------------------
+        Returns the whole listing of words as one string.
+        Use: text = w.format(count, words)
+        --------------------------------------------------------
+        Parameters:
+            count - The amount of possible words (int)
+            words - The possible words (iterable of str)
+        Returns:
+            The header and every row of words (str)
+        --------------------------------------------------------
+        """
+        return self._header(count) + "".join(self.rows(words))
+
+    def write(self, count, words):
+        """
+        --------------------------------------------------------
+        Writes the possible words to the .txt file. The rows
+        are joined and written in chunks through a buffered
+        file, so the listing is never built as one string.
+        Nothing is written in off mode.
+        Use: w.write(count, words)
+        --------------------------------------------------------
+        Parameters:
+            count - The amount of possible words (int)
+            words - The possible words (iterable of str)
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        if(self.mode == "off" or self.filename is None):
+            return
+
+        rows = self.rows(words)
+        f = open(self.filename, "w", buffering=1 << 16)
+        f.write(self._header(count))
+        chunk = list(islice(rows, ROWS_PER_CHUNK))
+
+        while(chunk):
+            f.write("".join(chunk))
+            chunk = list(islice(rows, ROWS_PER_CHUNK))
+
+        f.close()
+
+    def show(self, count, words):
+        """
+        --------------------------------------------------------
+        Prints the possible words in the current mode.
+        Use: w.show(count, words)
+        --------------------------------------------------------
+        Parameters:
+            count - The amount of possible words (int)
+            words - The possible words (iterable of str)
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        print(self._header(count), end="")
+
+        if(self.mode == "off"):
+            return
+
+        if(self.mode == "top"):
+            print("".join(self.rows(islice(words, self.limit))))
+            if(count > self.limit):
+                print("... and {:} more".format(count - self.limit))
+            return
+
+        if(self.mode == "full"):
+            print("".join(self.rows(words)))
+            return
+
+        rows = self.rows(words)
+        page = list(islice(rows, self.page_rows))
+
+        while(page):
+            print("".join(page))
+            page = list(islice(rows, self.page_rows))
+
+            if(page and input("Press Enter for more words, or Q to stop: ").upper() == "Q"):
+                break
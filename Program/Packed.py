@@ -0,0 +1,137 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Packed.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import numpy as np
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+WORD_LENGTH = 5
+LETTER_BITS = 5
+LETTER_MASK = (1 << LETTER_BITS) - 1
+
+# The first letter is stored in the highest bits, so packed words sort in alphabetical order
+_SHIFTS = np.array([LETTER_BITS * (WORD_LENGTH - 1 - i) for i in range(WORD_LENGTH)], dtype=np.uint32)
+
+def pack(codes):
+    """
+    --------------------------------------------------------
+    Packs words into one 32 bit integer each, 5 bits per
+    letter with the first letter in the highest bits, so 25
+    of the 32 bits are used and the packed words sort in the
+    same order as the words.
+    Use: packed = pack(codes)
+    --------------------------------------------------------
+    Parameters:
+        codes - An (N, 5) array of letter codes (0 - 25)
+                (np.ndarray)
+    Returns:
+        One packed word per row (np.ndarray of uint32)
+    --------------------------------------------------------
+    """
+    codes = np.asarray(codes, dtype=np.uint32).reshape(-1, WORD_LENGTH)
+
+    return np.bitwise_or.reduce(codes << _SHIFTS, axis=1).astype(np.uint32)
+
+
+def unpack(packed):
+    """
+    --------------------------------------------------------
+    Turns packed words back into letter codes.
+    Use: codes = unpack(packed)
+    --------------------------------------------------------
+    Parameters:
+        packed - Packed words (np.ndarray of uint32)
+    Returns:
+        An (N, 5) array of letter codes (np.ndarray of uint8)
+    --------------------------------------------------------
+    """
+    packed = np.asarray(packed, dtype=np.uint32).reshape(-1, 1)
+
+    return ((packed >> _SHIFTS) & LETTER_MASK).astype(np.uint8)
+
+
+def encode(word):
+    """
+    --------------------------------------------------------
+    Packs a single word.
+    Use: value = encode(word)
+    --------------------------------------------------------
+    Parameters:
+        word - A five letter word (str)
+    Returns:
+        The packed word, or -1 if word is not five letters
+        from a to z (int)
+    --------------------------------------------------------
+    """
+    if(len(word) != WORD_LENGTH or not word.isascii() or not word.isalpha()):
+        return -1
+
+    value = 0
+
+    for char in word.lower():
+        value = value << LETTER_BITS | (ord(char) - ord("a"))
+
+    return value
+
+
+def decode(value):
+    """
+    --------------------------------------------------------
+    Turns a packed word back into text.
+    Use: word = decode(value)
+    --------------------------------------------------------
+    Parameters:
+        value - A packed word (int)
+    Returns:
+        The word (str)
+    --------------------------------------------------------
+    """
+    value = int(value)
+
+    return "".join(ALPHABET[value >> int(shift) & LETTER_MASK] for shift in _SHIFTS)
+
+
+def letter_at(packed, i):
+    """
+    --------------------------------------------------------
+    Returns the letter code at position i of packed words.
+    Use: letters = letter_at(packed, i)
+    --------------------------------------------------------
+    Parameters:
+        packed - Packed words (np.ndarray of uint32 or int)
+        i - The position (int)
+    Returns:
+        The letter codes (np.ndarray of uint8 or int)
+    --------------------------------------------------------
+    """
+    if(np.ndim(packed) == 0):
+        return int(packed) >> int(_SHIFTS[i]) & LETTER_MASK
+
+    return ((np.asarray(packed, dtype=np.uint32) >> _SHIFTS[i]) & LETTER_MASK).astype(np.uint8)
+
+
+def letter_counts(codes):
+    """
+    --------------------------------------------------------
+    Counts how many times each letter appears in each word.
+    Use: counts = letter_counts(codes)
+    --------------------------------------------------------
+    Parameters:
+        codes - An (N, 5) array of letter codes (np.ndarray)
+    Returns:
+        An (N, 26) array of letter counts (np.ndarray)
+    --------------------------------------------------------
+    """
+    counts = np.zeros((len(codes), len(ALPHABET)), dtype=np.uint8)
+    rows = np.arange(len(codes))
+
+    for x in range(codes.shape[1]):
+        counts[rows, codes[:, x]] += 1
+
+    return counts
@@ -0,0 +1,801 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Patterns.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from Shared import SharedArrays, attach
+
+GRAY = 0
+YELLOW = 1
+GREEN = 2
+PATTERN_COUNT = 3 ** 5
+ALL_GREEN = PATTERN_COUNT - 1
+
+PATTERNS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words.patterns")
+PATTERN_CHARS = {"b": GRAY, "-": GRAY, "y": YELLOW, "g": GREEN}
+
+_MAGIC = b"WGPM"
+_VERSION = 1
+_HEADER = np.dtype([("magic", "S4"), ("version", "<u4"), ("digest", "u1", (32,)), ("rows", "<u4"), ("cols", "<u4")])
+_BLOCK = 256
+
+# Roughly how many bytes of temporary arrays one pattern needs while it is computed and scored
+_CELL_BYTES = 40
+DEFAULT_MEMORY = 64 * 1024 * 1024
+
+# The words and output file of a worker process that builds the matrix, opened once by _init_builder
+_worker_codes = None
+_worker_counts = None
+_worker_output = None
+
+# Lookup tables for score: the value of a green or yellow at each position, and the
+# place of each letter's count inside one int (3 bits per letter)
+_GREEN_AT = tuple(GREEN * 3 ** i for i in range(5))
+_YELLOW_AT = tuple(YELLOW * 3 ** i for i in range(5))
+_SHIFT = {chr(ord("a") + x): 3 * x for x in range(26)}
+_ONE = {char: 1 << shift for char, shift in _SHIFT.items()}
+
+def score(guess, answer):
+    """
+    --------------------------------------------------------
+    Computes the feedback pattern of one guess against one
+    answer. This is the reference every other way of
+    scoring is checked against (see Check.py). The greens are found first
+    and the letters of the answer they did not use are kept
+    as 3 bit counters inside a single int, then the other
+    letters of the guess are yellow from left to right while
+    a copy is left. Only lookup tables and small ints are
+    used, so no objects are made per call.
+    Use: code = score("speed", "abide")
+    --------------------------------------------------------
+    Parameters:
+        guess - A five letter word (str)
+        answer - A five letter word (str)
+    Returns:
+        The pattern code (int)
+    --------------------------------------------------------
+    """
+    code = 0
+    unused = 0
+
+    for i in range(5):
+        if(guess[i] == answer[i]):
+            code += _GREEN_AT[i]
+        else:
+            unused += _ONE[answer[i]]
+
+    for i in range(5):
+        char = guess[i]
+        if(char != answer[i] and unused >> _SHIFT[char] & 7):
+            code += _YELLOW_AT[i]
+            unused -= _ONE[char]
+
+    return code
+
+
+def feedback_codes(guess_codes, answer_codes, answer_counts):
+    """
+    --------------------------------------------------------
+    Computes the feedback pattern of every guess against
+    every answer. Each pattern is stored as a base 3 number
+    where the digit at position i is worth 3 ** i and is
+    GRAY (0), YELLOW (1) or GREEN (2). Repeated letters are
+    handled like the real game: a letter is only yellow
+    while the answer still has unused copies of it, from
+    left to right.
+    Use: codes = feedback_codes(guess_codes, answer_codes, answer_counts)
+    --------------------------------------------------------
+    Parameters:
+        guess_codes - A (G, 5) array of letter codes
+                      (np.ndarray)
+        answer_codes - An (A, 5) array of letter codes
+                       (np.ndarray)
+        answer_counts - An (A, 26) array of letter counts
+                        (np.ndarray)
+    Returns:
+        A (G, A) array of pattern codes, one byte each for
+        words of up to 5 letters (np.ndarray)
+    --------------------------------------------------------
+    """
+    guess_codes = np.asarray(guess_codes)
+    length = guess_codes.shape[1]
+    counts_by_letter = np.asarray(answer_counts).T
+    dtype = pattern_dtype(length)
+
+    greens = [guess_codes[:, i, None] == answer_codes[None, :, i] for i in range(length)]
+    output = np.zeros((len(guess_codes), len(answer_codes)), dtype=dtype)
+
+    for i in range(length):
+        same = [(guess_codes[:, j] == guess_codes[:, i])[:, None] for j in range(length)]
+
+        # Copies of the letter that are left once the greens are taken out
+        unused = counts_by_letter[guess_codes[:, i]].astype(np.int8)
+        earlier = np.zeros(output.shape, dtype=np.int8)
+
+        for j in range(length):
+            unused -= same[j] & greens[j]
+            if(j < i):
+                earlier += same[j] & ~greens[j]
+
+        yellow = ~greens[i] & (earlier < unused)
+
+        # Adding the bool arrays times a scalar of the output type keeps every temporary small
+        output += greens[i] * dtype(GREEN * 3 ** i)
+        output += yellow * dtype(YELLOW * 3 ** i)
+
+    return output
+
+
+def pattern_dtype(length):
+    """
+    --------------------------------------------------------
+    Returns the smallest unsigned type that holds every
+    pattern code of a word length.
+    Use: dtype = pattern_dtype(length)
+    --------------------------------------------------------
+    Parameters:
+        length - The amount of letters in a word (int)
+    Returns:
+        The NumPy type (type)
+    --------------------------------------------------------
+    """
+    if(3 ** length <= 1 << 8):
+        return np.uint8
+    if(3 ** length <= 1 << 16):
+        return np.uint16
+
+    return np.uint32
+
+
+def parse_pattern(pattern):
+    """
+    --------------------------------------------------------
+    Converts a pattern into its code. A pattern can already
+    be a code, or a 5 character string where 'g' is green,
+    'y' is yellow and 'b' or '-' is gray.
+    Use: code = parse_pattern("gy-bg")
+    --------------------------------------------------------
+    Parameters:
+        pattern - A pattern string or code (str or int)
+    Returns:
+        The pattern code (int)
+    --------------------------------------------------------
+    """
+    if(isinstance(pattern, str)):
+        if(len(pattern) != 5 or any(char not in PATTERN_CHARS for char in pattern.lower())):
+            raise ValueError("Invalid pattern: {:}".format(pattern))
+        return sum(PATTERN_CHARS[char] * 3 ** i for i, char in enumerate(pattern.lower()))
+
+    code = int(pattern)
+
+    if(code < 0 or code >= PATTERN_COUNT):
+        raise ValueError("Invalid pattern code: {:}".format(pattern))
+
+    return code
+
+
+def pattern_digits(code):
+    """
+    --------------------------------------------------------
+    Splits a pattern code into the colour of each position.
+    Use: digits = pattern_digits(code)
+    --------------------------------------------------------
+    Parameters:
+        code - A pattern code (int)
+    Returns:
+        GRAY, YELLOW or GREEN for each position (int[5])
+    --------------------------------------------------------
+    """
+    return [code // 3 ** i % 3 for i in range(5)]
+
+
+def realizable(guess, code):
+    """
+    --------------------------------------------------------
+    Returns whether the game can give a guess a pattern at
+    all. The copies of a letter that are not green are
+    yellow from left to right while the answer has copies
+    left, so a yellow copy can never come after a gray copy
+    of the same letter.
+    Use: ok = realizable("speed", code)
+    --------------------------------------------------------
+    Parameters:
+        guess - A five letter word (str)
+        code - A pattern code (int)
+    Returns:
+        True - Some answer could give the pattern
+        False - No answer gives the pattern
+    --------------------------------------------------------
+    """
+    digits = pattern_digits(code)
+    gray = set()
+
+    for i, char in enumerate(guess):
+        if(digits[i] == GRAY):
+            gray.add(char)
+        elif(digits[i] == YELLOW and char in gray):
+            return False
+
+    return True
+
+
+def format_pattern(code):
+    """
+    --------------------------------------------------------
+    Converts a pattern code into a string of 'g', 'y' and
+    'b' characters.
+    Use: text = format_pattern(code)
+    --------------------------------------------------------
+    Parameters:
+        code - A pattern code (int)
+    Returns:
+        The pattern string (str)
+    --------------------------------------------------------
+    """
+    return "".join("byg"[digit] for digit in pattern_digits(code))
+
+
+def open_matrix(filename, rows, cols):
+    """
+    --------------------------------------------------------
+    Memory-maps the patterns in a cache file without checking
+    the header. Worker processes use this to open a matrix
+    that their parent already checked.
+    Use: data = open_matrix(filename, rows, cols)
+    --------------------------------------------------------
+    Parameters:
+        filename - The path of the cache file (str)
+        rows - The amount of guesses (int)
+        cols - The amount of answers (int)
+    Returns:
+        A read-only (rows, cols) array (np.memmap)
+    --------------------------------------------------------
+    """
+    return np.memmap(filename, dtype=np.uint8, mode="r", offset=_HEADER.itemsize, shape=(rows, cols))
+
+
+def attach_matrix(arrays, info):
+    """
+    --------------------------------------------------------
+    Opens a matrix inside a worker process from the shared
+    arrays and the info its share method returned.
+    Use: matrix = attach_matrix(arrays, info)
+    --------------------------------------------------------
+    Parameters:
+        arrays - The attached shared arrays (dict)
+        info - The second value returned by share (tuple)
+    Returns:
+        The matrix (PatternMatrix or TiledMatrix)
+    --------------------------------------------------------
+    """
+    if(info[0] == "tiled"):
+        return TiledMatrix(arrays["codes"], arrays["counts"], info[1])
+
+    filename, rows, cols = info[1:]
+
+    if("matrix" in arrays):
+        return PatternMatrix.from_data(arrays["matrix"], filename)
+
+    return PatternMatrix.from_data(open_matrix(filename, rows, cols), filename)
+
+
+def load_matrix(engine, filename=PATTERNS_FILE, memory=None, spill=None, workers=1):
+    """
+    --------------------------------------------------------
+    Opens the patterns of every pair of words in the way
+    that fits a memory budget. When there is no budget, or
+    the full matrix fits in it, the cached matrix file is
+    used. Otherwise the patterns are computed in tiles that
+    stay under the budget.
+    Use: matrix = load_matrix(engine)
+    Use: matrix = load_matrix(engine, filename, memory, spill, workers)
+    --------------------------------------------------------
+    Parameters:
+        engine - The words to use (WordEngine)
+        filename - The path of the cache file (str)
+        memory - The most bytes of patterns to hold at once,
+                 None for no limit (int)
+        spill - A file where computed tiles are kept in
+                tiled mode, None to compute them every time
+                (str)
+        workers - The amount of processes used to build the
+                  cache file (int)
+    Returns:
+        The matrix (PatternMatrix or TiledMatrix)
+    --------------------------------------------------------
+    """
+    if(memory is None or len(engine) * len(engine) <= memory):
+        return PatternMatrix(engine, filename, workers)
+
+    return TiledMatrix(engine.codes, engine.counts, memory, spill)
+
+
+def _init_builder(spec, filename, n):
+    """
+    --------------------------------------------------------
+    Opens the shared letter codes and counts and the file
+    being built inside a worker process.
+    Use: _init_builder(spec, filename, n)
+    --------------------------------------------------------
+    Parameters:
+        spec - The spec of the shared arrays (dict)
+        filename - The path of the file being built (str)
+        n - The amount of words (int)
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    global _worker_codes, _worker_counts, _worker_output
+    arrays = attach(spec)
+    _worker_codes = arrays["codes"]
+    _worker_counts = arrays["counts"]
+    _worker_output = np.memmap(filename, dtype=np.uint8, mode="r+", offset=_HEADER.itemsize, shape=(n, n))
+
+
+def _build_rows(start, stop):
+    """
+    --------------------------------------------------------
+    Computes the rows start to stop of the matrix inside a
+    worker process and writes them straight to the file.
+    Use: _build_rows(start, stop)
+    --------------------------------------------------------
+    Parameters:
+        start - The first guess id (int)
+        stop - The guess id after the last one (int)
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    for x in range(start, stop, _BLOCK):
+        end = min(x + _BLOCK, stop)
+        _worker_output[x:end] = feedback_codes(_worker_codes[x:end], _worker_codes, _worker_counts)
+
+    _worker_output.flush()
+
+
+class PatternMatrix:
+
+    def __init__(self, engine, filename, workers=1):
+        """
+        --------------------------------------------------------
+        Opens the guess by answer pattern matrix for the words
+        in engine. The matrix is memory-mapped from filename.
+        If the file does not exist or was built from a
+        different word list, it is computed and saved first.
+        Use: m = PatternMatrix(engine, filename)
+        Use: m = PatternMatrix(engine, filename, workers)
+        --------------------------------------------------------
+        Parameters:
+            engine - The words to use (WordEngine)
+            filename - The path of the cache file (str)
+            workers - The amount of processes used to build the
+                      file (int)
+        Returns:
+            A new PatternMatrix object (PatternMatrix)
+        --------------------------------------------------------
+        """
+        self.filename = filename
+        self.codes = engine.codes
+        self._workers = workers
+        self._engine = engine
+        self._digest = engine.digest()
+
+        if(not self._is_current()):
+            self._build()
+
+        self.data = open_matrix(filename, len(engine), len(engine))
+
+        return
+
+    @classmethod
+    def from_data(cls, data, filename=None):
+        """
+        --------------------------------------------------------
+        Wraps an array of patterns that is already open, such
+        as the matrix inside a worker process.
+        Use: m = PatternMatrix.from_data(data, filename)
+        --------------------------------------------------------
+        Parameters:
+            data - A (rows, cols) array of patterns (np.ndarray)
+            filename - The path of the cache file, if any (str)
+        Returns:
+            A new PatternMatrix object (PatternMatrix)
+        --------------------------------------------------------
+        """
+        matrix = cls.__new__(cls)
+        matrix.filename = filename
+        matrix.codes = None
+        matrix.data = data
+
+        return matrix
+
+    @property
+    def shape(self):
+        """
+        --------------------------------------------------------
+        Returns the amount of guesses and answers.
+        Use: rows, cols = m.shape
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            (rows, cols) (tuple)
+        --------------------------------------------------------
+        """
+        return self.data.shape
+
+    def __len__(self):
+        """
+        --------------------------------------------------------
+        Returns the amount of guesses.
+        Use: n = len(m)
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The amount of rows (int)
+        --------------------------------------------------------
+        """
+        return len(self.data)
+
+    def block_rows(self, count):
+        """
+        --------------------------------------------------------
+        Returns how many rows should be read at a time.
+        Use: step = m.block_rows(count)
+        --------------------------------------------------------
+        Parameters:
+            count - The amount of columns that are read (int)
+        Returns:
+            The amount of rows (int)
+        --------------------------------------------------------
+        """
+        return _BLOCK
+
+    def rows(self, start, stop, columns):
+        """
+        --------------------------------------------------------
+        Returns the patterns of the guesses start to stop
+        against some answers.
+        Use: codes = m.rows(start, stop, columns)
+        --------------------------------------------------------
+        Parameters:
+            start - The first guess id (int)
+            stop - The guess id after the last one (int)
+            columns - The ids of the answers (np.ndarray)
+        Returns:
+            A (stop - start, len(columns)) array of pattern
+            codes (np.ndarray)
+        --------------------------------------------------------
+        """
+        return self.data[start:stop][:, columns]
+
+    def take(self, guesses, columns):
+        """
+        --------------------------------------------------------
+        Returns the patterns of some guesses against some
+        answers.
+        Use: codes = m.take(guesses, columns)
+        --------------------------------------------------------
+        Parameters:
+            guesses - The ids of the guesses (np.ndarray)
+            columns - The ids of the answers (np.ndarray)
+        Returns:
+            A (len(guesses), len(columns)) array of pattern
+            codes (np.ndarray)
+        --------------------------------------------------------
+        """
+        return self.data[np.ix_(guesses, columns)]
+
+    def share(self, share_matrix=False, workers=1):
+        """
+        --------------------------------------------------------
+        Returns what a worker process needs to open this matrix
+        with attach_matrix.
+        Use: arrays, info = m.share(share_matrix)
+        Use: arrays, info = m.share(share_matrix, workers)
+        --------------------------------------------------------
+        Parameters:
+            share_matrix - Puts the matrix itself in shared
+                           memory instead of memory-mapping the
+                           file in every worker (bool)
+            workers - The amount of workers that will open it,
+                      not used since the file is shared (int)
+        Returns:
+            The arrays to put in shared memory and a small
+            picklable description (tuple)
+        --------------------------------------------------------
+        """
+        arrays = {"matrix": self.data} if(share_matrix) else {}
+
+        return arrays, ("file", self.filename) + self.data.shape
+
+    def __getitem__(self, key):
+        """
+        --------------------------------------------------------
+        A Python magic method that allows you to index the
+        matrix like an array. Rows are guesses and columns are
+        answers.
+        Use: codes = m[guess_ids, answer_ids]
+        --------------------------------------------------------
+        Parameters:
+            key - Any NumPy index (object)
+        Returns:
+            The pattern codes at key (np.ndarray or int)
+        --------------------------------------------------------
+        """
+        return self.data[key]
+
+    def _is_current(self):
+        """
+        --------------------------------------------------------
+        Checks if the cache file exists and was built from the
+        current word list.
+        Use: self._is_current()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            True - The cache file can be used
+            False - The cache file needs to be built
+        --------------------------------------------------------
+        """
+        n = len(self._engine)
+
+        if(not os.path.exists(self.filename)):
+            return False
+
+        if(os.path.getsize(self.filename) != _HEADER.itemsize + n * n):
+            return False
+
+        header = np.fromfile(self.filename, dtype=_HEADER, count=1)[0]
+
+        return (header["magic"] == _MAGIC and header["version"] == _VERSION
+                and header["digest"].tobytes() == self._digest and header["rows"] == n and header["cols"] == n)
+
+    def _build(self):
+        """
+        --------------------------------------------------------
+        Computes every pattern block by block and writes the
+        result to the cache file. The file is written under a
+        temporary name first so a stopped build never leaves a
+        broken cache behind. With more than one worker, the
+        letter codes and counts are put in shared memory and
+        each worker writes its own rows of the file.
+        Use: self._build()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        n = len(self._engine)
+        temp = self.filename + ".tmp"
+
+        header = np.zeros(1, dtype=_HEADER)
+        header[0] = (_MAGIC, _VERSION, np.frombuffer(self._digest, dtype=np.uint8), n, n)
+
+        f = open(temp, "wb")
+        f.write(header.tobytes())
+
+        if(self._workers > 1):
+            f.truncate(_HEADER.itemsize + n * n)
+            f.close()
+
+            size = -(-n // (self._workers * 4))
+            arrays = {"codes": self._engine.codes, "counts": self._engine.counts}
+
+            with SharedArrays(arrays) as shared:
+                pool = ProcessPoolExecutor(self._workers, initializer=_init_builder, initargs=(shared.spec, temp, n))
+                try:
+                    for future in [pool.submit(_build_rows, x, min(x + size, n)) for x in range(0, n, size)]:
+                        future.result()
+                finally:
+                    pool.shutdown()
+        else:
+            for start in range(0, n, _BLOCK):
+                block = feedback_codes(self._engine.codes[start:start + _BLOCK], self._engine.codes, self._engine.counts)
+                f.write(block.tobytes())
+
+            f.close()
+
+        os.replace(temp, self.filename)
+
+        return
+
+
+class TiledMatrix:
+
+    def __init__(self, codes, counts, memory=DEFAULT_MEMORY, spill=None):
+        """
+        --------------------------------------------------------
+        Acts like a PatternMatrix without ever holding all of
+        it. Patterns are computed from the letter codes when
+        they are asked for, a block of rows at a time, so the
+        patterns and the temporary arrays used to compute them
+        stay under memory bytes no matter how many words there
+        are. If spill is given, each tile of rows is computed
+        the first time it is used and kept in a memory-mapped
+        file, so later reads come from the file instead.
+        Use: m = TiledMatrix(codes, counts)
+        Use: m = TiledMatrix(codes, counts, memory, spill)
+        --------------------------------------------------------
+        Parameters:
+            codes - An (N, L) array of letter codes (np.ndarray)
+            counts - An (N, 26) array of letter counts
+                     (np.ndarray)
+            memory - The most bytes to use at once (int)
+            spill - The path of the file that keeps computed
+                    tiles, None to compute them every time (str)
+        Returns:
+            A new TiledMatrix object (TiledMatrix)
+        --------------------------------------------------------
+        """
+        self.codes = codes
+        self.counts = counts
+        self.memory = memory
+        self.filename = None
+        self.shape = (len(codes), len(codes))
+        self._spill = None
+        self._done = None
+
+        if(spill is not None):
+            self._spill = np.memmap(spill, dtype=pattern_dtype(codes.shape[1]), mode="w+", shape=self.shape)
+            self._done = np.zeros(-(-len(codes) // _BLOCK), dtype=bool)
+
+        return
+
+    def __len__(self):
+        """
+        --------------------------------------------------------
+        Returns the amount of guesses.
+        Use: n = len(m)
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The amount of rows (int)
+        --------------------------------------------------------
+        """
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        """
+        --------------------------------------------------------
+        Returns the patterns of one guess, like indexing a
+        PatternMatrix with m[guess, answers].
+        Use: codes = m[guess, answer_ids]
+        Use: code = m[guess, answer]
+        --------------------------------------------------------
+        Parameters:
+            key - A guess id and an answer id or ids (tuple)
+        Returns:
+            The pattern codes (np.ndarray or int)
+        --------------------------------------------------------
+        """
+        guess, columns = key
+
+        if(np.ndim(columns) == 0):
+            return self.rows(guess, guess + 1, [columns])[0, 0]
+
+        return self.rows(guess, guess + 1, columns)[0]
+
+    def block_rows(self, count):
+        """
+        --------------------------------------------------------
+        Returns how many rows can be computed at a time against
+        count answers without going over the budget.
+        Use: step = m.block_rows(count)
+        --------------------------------------------------------
+        Parameters:
+            count - The amount of columns that are read (int)
+        Returns:
+            The amount of rows, at least 1 (int)
+        --------------------------------------------------------
+        """
+        return max(1, self.memory // (_CELL_BYTES * max(count, 1)))
+
+    def rows(self, start, stop, columns):
+        """
+        --------------------------------------------------------
+        Returns the patterns of the guesses start to stop
+        against some answers. Callers should ask for at most
+        block_rows(len(columns)) rows at a time.
+        Use: codes = m.rows(start, stop, columns)
+        --------------------------------------------------------
+        Parameters:
+            start - The first guess id (int)
+            stop - The guess id after the last one (int)
+            columns - The ids of the answers (np.ndarray)
+        Returns:
+            A (stop - start, len(columns)) array of pattern
+            codes (np.ndarray)
+        --------------------------------------------------------
+        """
+        if(self._spill is None):
+            return feedback_codes(self.codes[start:stop], self.codes[columns], self.counts[columns])
+
+        for tile in range(start // _BLOCK, -(-stop // _BLOCK)):
+            if(not self._done[tile]):
+                self._fill(tile)
+
+        return self._spill[start:stop][:, columns]
+
+    def take(self, guesses, columns):
+        """
+        --------------------------------------------------------
+        Returns the patterns of some guesses against some
+        answers. Callers should ask for at most
+        block_rows(len(columns)) guesses at a time.
+        Use: codes = m.take(guesses, columns)
+        --------------------------------------------------------
+        Parameters:
+            guesses - The ids of the guesses (np.ndarray)
+            columns - The ids of the answers (np.ndarray)
+        Returns:
+            A (len(guesses), len(columns)) array of pattern
+            codes (np.ndarray)
+        --------------------------------------------------------
+        """
+        if(self._spill is None):
+            return feedback_codes(self.codes[guesses], self.codes[columns], self.counts[columns])
+
+        for tile in np.unique(np.asarray(guesses) // _BLOCK):
+            if(not self._done[tile]):
+                self._fill(tile)
+
+        return self._spill[np.ix_(guesses, columns)]
+
+    def _fill(self, tile):
+        """
+        --------------------------------------------------------
+        Computes the rows of a tile against every answer and
+        writes them to the spill file, a few rows at a time.
+        Use: self._fill(tile)
+        --------------------------------------------------------
+        Parameters:
+            tile - The index of the tile (int)
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        end = min((tile + 1) * _BLOCK, self.shape[0])
+        step = self.block_rows(self.shape[1])
+
+        for start in range(tile * _BLOCK, end, step):
+            stop = min(start + step, end)
+            self._spill[start:stop] = feedback_codes(self.codes[start:stop], self.codes, self.counts)
+
+        self._done[tile] = True
+
+    def share(self, share_matrix=False, workers=1):
+        """
+        --------------------------------------------------------
+        Returns what a worker process needs to open this matrix
+        with attach_matrix. Workers compute their own tiles
+        from the shared letter codes and counts, and the budget
+        is split between them so all of them together stay
+        under it; the spill file is not shared.
+        Use: arrays, info = m.share()
+        Use: arrays, info = m.share(share_matrix, workers)
+        --------------------------------------------------------
+        Parameters:
+            share_matrix - Not used, there is no full matrix to
+                           share (bool)
+            workers - The amount of workers that will open it
+                      (int)
+        Returns:
+            The arrays to put in shared memory and a small
+            picklable description (tuple)
+        --------------------------------------------------------
+        """
+        return {"codes": self.codes, "counts": self.counts}, ("tiled", self.memory // max(workers, 1))
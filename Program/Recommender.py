@@ -0,0 +1,735 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Recommender.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from Constraints import ALPHABET
+from Patterns import PATTERN_COUNT, attach_matrix
+from Shared import SharedArrays, attach
+
+_BLOCK = 256
+_CHUNK = 1024
+
+# The pool can be started from a background search, and forking a process that runs other threads can deadlock
+_START_METHOD = "forkserver" if("forkserver" in multiprocessing.get_all_start_methods()) else "spawn"
+
+# The pattern matrix and the guess, candidate and weight blocks of a worker process, opened once by _init_worker
+_worker_matrix = None
+_worker_guesses = None
+_worker_candidates = None
+_worker_weights = None
+
+def partition_sizes(rows):
+    """
+    --------------------------------------------------------
+    Counts how many candidates each guess puts in each
+    feedback pattern.
+    Use: sizes = partition_sizes(rows)
+    --------------------------------------------------------
+    Parameters:
+        rows - A (G, C) array with the pattern of each guess
+               against each candidate (np.ndarray)
+    Returns:
+        A (G, 243) array of group sizes (np.ndarray)
+    --------------------------------------------------------
+    """
+    guesses = rows.shape[0]
+    offsets = (np.arange(guesses, dtype=np.int32) * PATTERN_COUNT)[:, None]
+    sizes = np.bincount((rows + offsets).ravel(), minlength=guesses * PATTERN_COUNT)
+
+    return sizes.reshape(guesses, PATTERN_COUNT)
+
+
+def entropies(rows, weights=None):
+    """
+    --------------------------------------------------------
+    Computes the expected information of each guess. A
+    guess splits the candidates into groups that share the
+    same feedback pattern, and the entropy of those groups
+    is the amount of information (in bits) the guess gives
+    on average. With weights, each candidate counts as much
+    as its weight instead of 1, so a group is as likely as
+    the total prior of its candidates.
+    Use: bits = entropies(rows)
+    Use: bits = entropies(rows, weights)
+    --------------------------------------------------------
+    Parameters:
+        rows - A (G, C) array with the pattern of each guess
+               against each candidate (np.ndarray)
+        weights - The prior weight of each candidate, or None
+                  for equal weights (np.ndarray)
+    Returns:
+        The entropy of every guess (np.ndarray)
+    --------------------------------------------------------
+    """
+    if(weights is None):
+        sizes = partition_sizes(rows)
+        total = rows.shape[1]
+    else:
+        guesses = rows.shape[0]
+        offsets = (np.arange(guesses, dtype=np.int32) * PATTERN_COUNT)[:, None]
+        sizes = np.bincount((rows + offsets).ravel(), weights=np.broadcast_to(weights, rows.shape).ravel(),
+                            minlength=guesses * PATTERN_COUNT).reshape(guesses, PATTERN_COUNT)
+        total = float(np.sum(weights, dtype=np.float64))
+
+    p = sizes / total
+    logs = np.log2(p, out=np.zeros_like(p), where=sizes > 0)
+
+    return -(p * logs).sum(axis=1)
+
+
+def effective(candidates, weights=None):
+    """
+    --------------------------------------------------------
+    Returns the candidates that are scored and their prior
+    weights. Without weights every candidate is kept. With
+    weights, the candidates with no weight are dropped,
+    unless that would drop them all, in which case the rest
+    are treated as equally likely.
+    Use: candidates, weights = effective(candidates, weights)
+    --------------------------------------------------------
+    Parameters:
+        candidates - The ids of the remaining words
+                     (np.ndarray)
+        weights - The prior weight of every word id, or None
+                  (np.ndarray)
+    Returns:
+        The candidates to score and their weights, or None
+        for equal weights (tuple)
+    --------------------------------------------------------
+    """
+    candidates = np.asarray(candidates)
+
+    if(weights is None):
+        return candidates, None
+
+    weights = weights[candidates]
+    kept = weights > 0
+
+    if(not kept.any()):
+        return candidates, None
+
+    if(not kept.all()):
+        candidates = candidates[kept]
+        weights = weights[kept]
+
+    return candidates, weights
+
+
+def score_rows(matrix, start, stop, candidates, weights=None):
+    """
+    --------------------------------------------------------
+    Computes the entropy of the guesses start to stop, a
+    block of rows at a time so only one block of patterns is
+    held at once.
+    Use: bits = score_rows(matrix, start, stop, candidates)
+    Use: bits = score_rows(matrix, start, stop, candidates, weights)
+    --------------------------------------------------------
+    Parameters:
+        matrix - The guess by answer patterns (PatternMatrix
+                 or TiledMatrix)
+        start - The first guess id (int)
+        stop - The guess id after the last one (int)
+        candidates - The ids of the remaining words
+                     (np.ndarray)
+        weights - The prior weight of each candidate, or None
+                  for equal weights (np.ndarray)
+    Returns:
+        The entropy of every guess in the range (np.ndarray)
+    --------------------------------------------------------
+    """
+    step = matrix.block_rows(len(candidates))
+    blocks = [entropies(matrix.rows(x, min(x + step, stop), candidates), weights) for x in range(start, stop, step)]
+
+    if(not blocks):
+        return np.zeros(0)
+
+    return np.concatenate(blocks)
+
+
+def score_guesses(matrix, guesses, candidates, weights=None):
+    """
+    --------------------------------------------------------
+    Computes the entropy of some guesses, a block of guesses
+    at a time so only one block of patterns is held at once.
+    Use: bits = score_guesses(matrix, guesses, candidates)
+    Use: bits = score_guesses(matrix, guesses, candidates, weights)
+    --------------------------------------------------------
+    Parameters:
+        matrix - The guess by answer patterns (PatternMatrix
+                 or TiledMatrix)
+        guesses - The ids of the guesses (np.ndarray)
+        candidates - The ids of the remaining words
+                     (np.ndarray)
+        weights - The prior weight of each candidate, or None
+                  for equal weights (np.ndarray)
+    Returns:
+        The entropy of every guess, in the order of guesses
+        (np.ndarray)
+    --------------------------------------------------------
+    """
+    step = matrix.block_rows(len(candidates))
+    blocks = [entropies(matrix.take(guesses[x:x + step], candidates), weights) for x in range(0, len(guesses), step)]
+
+    if(not blocks):
+        return np.zeros(0)
+
+    return np.concatenate(blocks)
+
+
+def distinct_guesses(codes, candidates):
+    """
+    --------------------------------------------------------
+    Groups the guesses that get the same pattern against
+    every candidate. A letter that no candidate has is always
+    gray wherever it is played and does not change the
+    colour of any other letter, so it can be replaced by a
+    wildcard. Guesses that are the same after that are
+    equivalent, and only the first of each group has to be
+    scored. Guesses made only of such letters are all gray
+    against every candidate, which gives no information, so
+    they are left out altogether.
+    Use: guesses, groups = distinct_guesses(codes, candidates)
+    --------------------------------------------------------
+    Parameters:
+        codes - An (N, L) array with the letter codes of every
+                guess (np.ndarray)
+        candidates - The ids of the remaining words
+                     (np.ndarray)
+    Returns:
+        The ids of the guesses to score, and for every guess
+        the index of its group in them, or -1 if it gives no
+        information (tuple)
+    --------------------------------------------------------
+    """
+    wildcard = len(ALPHABET)
+    live = np.zeros(wildcard, dtype=bool)
+    live[codes[candidates].ravel()] = True
+
+    projected = np.where(live[codes], codes, wildcard).astype(np.int64)
+    keys = (projected * (wildcard + 1) ** np.arange(codes.shape[1], dtype=np.int64)).sum(axis=1)
+    unique, first, groups = np.unique(keys, return_index=True, return_inverse=True)
+    groups = groups.astype(np.int32)
+
+    # The wildcard is the largest digit, so a guess of nothing but dead letters has the largest key
+    if(len(unique) and unique[-1] == (wildcard + 1) ** codes.shape[1] - 1):
+        first = first[:-1]
+        groups[groups == len(first)] = -1
+
+    return first.astype(np.int32), groups
+
+
+def expand(bits, groups):
+    """
+    --------------------------------------------------------
+    Gives every guess the entropy of its group.
+    Use: bits = expand(bits, groups)
+    --------------------------------------------------------
+    Parameters:
+        bits - The entropy of each group (np.ndarray)
+        groups - The group of every guess, -1 for none
+                 (np.ndarray)
+    Returns:
+        The entropy of every guess, 0 for the guesses in no
+        group (np.ndarray)
+    --------------------------------------------------------
+    """
+    return np.where(groups >= 0, np.append(bits, 0.0)[groups], 0.0)
+
+
+def rank(bits, candidates, weights, k):
+    """
+    --------------------------------------------------------
+    Returns the k guesses with the most expected information.
+    When two guesses tie, the one that could still be the
+    answer comes first, and then the one with the higher
+    prior weight.
+    Use: best = rank(bits, candidates, weights, k)
+    --------------------------------------------------------
+    Parameters:
+        bits - The entropy of the first len(bits) guesses
+               (np.ndarray)
+        candidates - The ids of the scored candidates
+                     (np.ndarray)
+        weights - The weight of each candidate, or None
+                  (np.ndarray)
+        k - The amount of guesses to return (int)
+    Returns:
+        A list of (guess id, entropy) pairs, best first (list)
+    --------------------------------------------------------
+    """
+    scored = candidates < len(bits)
+    possible = np.zeros(len(bits), dtype=bool)
+    possible[candidates[scored]] = True
+    prior = np.zeros(len(bits), dtype=np.float32)
+
+    if(weights is not None):
+        prior[candidates[scored]] = weights[scored]
+
+    order = np.lexsort((-prior, ~possible, -bits))[:k]
+
+    return [(int(x), float(bits[x])) for x in order]
+
+
+def _init_worker(spec, info):
+    """
+    --------------------------------------------------------
+    Opens the shared arrays inside a worker process. The
+    guesses, candidates and weights are always shared. The
+    pattern matrix is opened from shared memory, from its
+    memory-mapped file, or computed in tiles from the shared
+    words (see attach_matrix), so every worker reads the same
+    pages instead of getting its own copy.
+    Use: _init_worker(spec, info)
+    --------------------------------------------------------
+    Parameters:
+        spec - The spec of the shared arrays (dict)
+        info - How to open the matrix (tuple)
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    global _worker_matrix, _worker_guesses, _worker_candidates, _worker_weights
+    arrays = attach(spec)
+    _worker_guesses = arrays["guesses"]
+    _worker_candidates = arrays["candidates"]
+    _worker_weights = arrays.get("weights")
+    _worker_matrix = attach_matrix(arrays, info)
+
+
+def _score_block(start, stop, count, weighted=False):
+    """
+    --------------------------------------------------------
+    Scores the entries start to stop of the shared guess
+    block inside a worker process, against the first count
+    ids of the shared candidate block, weighted by the first
+    count entries of the shared weight block if weighted is
+    set.
+    Use: bits = _score_block(start, stop, count)
+    --------------------------------------------------------
+    Parameters:
+        start - The first entry of the guess block (int)
+        stop - The entry after the last one (int)
+        count - The amount of candidates (int)
+        weighted - Whether to use the shared weights (bool)
+    Returns:
+        The entropy of every guess in the block (np.ndarray)
+    --------------------------------------------------------
+    """
+    weights = _worker_weights[:count] if(weighted) else None
+
+    return score_guesses(_worker_matrix, _worker_guesses[start:stop], _worker_candidates[:count], weights)
+
+
+class Recommender:
+
+    def __init__(self, matrix, workers=None, share_matrix=False, weights=None, prune=True):
+        """
+        --------------------------------------------------------
+        Creates a new Recommender which ranks guesses by the
+        entropy of the feedback they would give. When there is
+        more than one worker the scoring is split over a process
+        pool. The candidate ids are written to a shared memory
+        block (see Shared.py) and each worker opens the pattern
+        matrix once, so a task only sends a range of guess ids
+        and the amount of candidates. With prior weights (see
+        Weights.py) every candidate is as likely as its weight,
+        and candidates with no weight are left out of the
+        scoring, unless none of the candidates have any weight.
+        Guesses that would get the same patterns as another
+        guess are only scored once (see distinct_guesses), so
+        the cost follows the amount of different guesses
+        rather than the size of the word list.
+        Use: r = Recommender(matrix)
+        Use: r = Recommender(matrix, workers, share_matrix, weights, prune)
+        --------------------------------------------------------
+        Parameters:
+            matrix - The guess by answer patterns
+                     (PatternMatrix or TiledMatrix)
+            workers - The amount of processes to use, defaults
+                      to the amount of CPUs (int)
+            share_matrix - Copies the matrix into shared memory
+                           instead of memory-mapping its file in
+                           every worker (bool)
+            weights - The prior weight of every word id, or None
+                      for equal weights (np.ndarray)
+            prune - Skips equivalent guesses (bool)
+        Returns:
+            A new Recommender object (Recommender)
+        --------------------------------------------------------
+        """
+        self._matrix = matrix
+        self.weights = weights
+        # How many guesses the latest search scored, out of how many
+        self.pool = (len(matrix), len(matrix))
+        self._prune = prune
+        self._workers = workers or os.cpu_count() or 1
+        self._share_matrix = share_matrix
+        self._pool = None
+        self._shared = None
+        self._lock = threading.Lock()
+
+        return
+
+    def close(self):
+        """
+        --------------------------------------------------------
+        Shuts down the worker processes and removes the shared
+        memory blocks.
+        Use: r.close()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        with self._lock:
+            if(self._pool is not None):
+                self._pool.shutdown()
+                self._pool = None
+
+            if(self._shared is not None):
+                self._shared.close()
+                self._shared = None
+
+    def distinct(self, candidates):
+        """
+        --------------------------------------------------------
+        Returns the guesses that have to be scored against the
+        candidates (see distinct_guesses), and records how much
+        the pool shrank in self.pool. Without the letter codes
+        of the guesses, or with pruning turned off, every guess
+        is scored.
+        Use: guesses, groups = r.distinct(candidates)
+        --------------------------------------------------------
+        Parameters:
+            candidates - The ids of the scored candidates
+                         (np.ndarray)
+        Returns:
+            The ids of the guesses to score, and for every guess
+            the index of its group in them, or -1 if it gives no
+            information (tuple)
+        --------------------------------------------------------
+        """
+        rows = len(self._matrix)
+
+        if(self._prune and self._matrix.codes is not None):
+            guesses, groups = distinct_guesses(self._matrix.codes, candidates)
+        else:
+            guesses = np.arange(rows, dtype=np.int32)
+            groups = guesses
+
+        self.pool = (len(guesses), rows)
+
+        return guesses, groups
+
+    def _score(self, guesses, candidates, weights):
+        """
+        --------------------------------------------------------
+        Computes the entropy of some guesses, over the worker
+        pool if there is more than one worker.
+        Use: bits = self._score(guesses, candidates, weights)
+        --------------------------------------------------------
+        Parameters:
+            guesses - The ids of the guesses (np.ndarray)
+            candidates - The ids of the scored candidates
+                         (np.ndarray)
+            weights - The weight of each candidate, or None
+                      (np.ndarray)
+        Returns:
+            The entropy of every guess, in the order of guesses
+            (np.ndarray)
+        --------------------------------------------------------
+        """
+        rows, cols = self._matrix.shape
+
+        if(self._workers == 1):
+            return score_guesses(self._matrix, guesses, candidates, weights)
+
+        # The shared blocks are used by every call, so only one thread can score at a time
+        with self._lock:
+            if(self._pool is None):
+                arrays, info = self._matrix.share(self._share_matrix, self._workers)
+                arrays["guesses"] = np.zeros(rows, dtype=np.int32)
+                arrays["candidates"] = np.zeros(cols, dtype=np.int32)
+                arrays["weights"] = np.zeros(cols, dtype=np.float32)
+                self._shared = SharedArrays(arrays)
+                self._pool = ProcessPoolExecutor(self._workers, multiprocessing.get_context(_START_METHOD),
+                                                 initializer=_init_worker, initargs=(self._shared.spec, info))
+
+            self._shared["guesses"][:len(guesses)] = guesses
+            self._shared["candidates"][:len(candidates)] = candidates
+
+            if(weights is not None):
+                self._shared["weights"][:len(candidates)] = weights
+
+            size = max(_BLOCK, -(-len(guesses) // (self._workers * 4)))
+            starts = range(0, len(guesses), size)
+            futures = [self._pool.submit(_score_block, x, min(x + size, len(guesses)), len(candidates),
+                                         weights is not None) for x in starts]
+
+            if(not futures):
+                return np.zeros(0)
+
+            return np.concatenate([future.result() for future in futures])
+
+    def scores(self, candidates):
+        """
+        --------------------------------------------------------
+        Computes the entropy of every guess against the
+        remaining candidates, weighted by their priors if the
+        recommender has weights. Only one guess of each group
+        of equivalent guesses is scored.
+        Use: bits = r.scores(candidates)
+        --------------------------------------------------------
+        Parameters:
+            candidates - The ids of the remaining words
+                         (np.ndarray)
+        Returns:
+            The entropy of every guess, indexed by guess id
+            (np.ndarray)
+        --------------------------------------------------------
+        """
+        candidates, weights = effective(candidates, self.weights)
+        guesses, groups = self.distinct(candidates)
+
+        return expand(self._score(guesses, candidates, weights), groups)
+
+    def recommend(self, candidates, k=10):
+        """
+        --------------------------------------------------------
+        Returns the k guesses with the most expected information.
+        When two guesses tie, the one that could still be the
+        answer comes first, and then the one with the higher
+        prior weight.
+        Use: best = r.recommend(candidates)
+        Use: best = r.recommend(candidates, k)
+        --------------------------------------------------------
+        Parameters:
+            candidates - The ids of the remaining words
+                         (np.ndarray)
+            k - The amount of guesses to return (int)
+        Returns:
+            A list of (guess id, entropy) pairs, best first
+            (list)
+        --------------------------------------------------------
+        """
+        candidates, weights = effective(candidates, self.weights)
+
+        if(len(candidates) <= 1):
+            return [(int(x), 0.0) for x in candidates[:k]]
+
+        return rank(self.scores(candidates), candidates, weights, k)
+
+
+class Search:
+
+    def __init__(self, recommender, candidates, k=10, chunk=_CHUNK):
+        """
+        --------------------------------------------------------
+        Starts scoring every guess in a background thread, a
+        chunk of guesses at a time, so the result can be ready
+        by the time it is asked for. Like Recommender.scores,
+        only one guess of each group of equivalent guesses is
+        scored. The best guesses of the chunks scored so far
+        can be read at any time, and the
+        search can be cancelled between two chunks. When it is
+        done, the size of the largest group of candidates each
+        of the best guesses can leave is worked out as well.
+        Use: search = Search(recommender, candidates)
+        Use: search = Search(recommender, candidates, k, chunk)
+        --------------------------------------------------------
+        Parameters:
+            recommender - Scores the guesses (Recommender)
+            candidates - The ids of the remaining words
+                         (np.ndarray)
+            k - The amount of guesses to keep (int)
+            chunk - The amount of guesses scored between two
+                    checks for cancellation (int)
+        Returns:
+            A new Search object (Search)
+        --------------------------------------------------------
+        """
+        self.k = k
+        self.largest = {}
+        self._recommender = recommender
+        self._candidates = np.asarray(candidates)
+        self._effective = effective(self._candidates, recommender.weights)
+        self._guesses, self._groups = recommender.distinct(self._effective[0])
+        self.pool = recommender.pool
+        self._chunk = chunk
+        self._bits = np.full(len(self._guesses), -np.inf)
+        self._scored = 0
+        self._error = None
+        self._complete = False
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._finished = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+        return
+
+    def _run(self):
+        """
+        --------------------------------------------------------
+        Scores the guesses one chunk at a time until every
+        guess is scored or the search is cancelled.
+        Use: self._run()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        matrix = self._recommender._matrix
+        candidates, weights = self._effective
+
+        try:
+            for start in range(0, len(self._guesses), self._chunk):
+                if(self._cancelled.is_set()):
+                    return
+
+                bits = self._recommender._score(self._guesses[start:start + self._chunk], candidates, weights)
+
+                with self._lock:
+                    self._bits[start:start + len(bits)] = bits
+                    self._scored += len(bits)
+
+            for guess, bits in self.best():
+                sizes = partition_sizes(matrix.rows(guess, guess + 1, self._candidates))
+                self.largest[guess] = int(sizes.max())
+
+            self._complete = True
+        except Exception as error:
+            self._error = error
+        finally:
+            self._finished.set()
+
+    def cancel(self):
+        """
+        --------------------------------------------------------
+        Stops the search after the chunk that is being scored.
+        The guesses scored so far can still be read.
+        Use: search.cancel()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        self._cancelled.set()
+
+    def done(self):
+        """
+        --------------------------------------------------------
+        Returns whether the search has stopped, because every
+        guess was scored, it was cancelled or it failed.
+        Use: finished = search.done()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            True - The search has stopped
+            False - The search is still running
+        --------------------------------------------------------
+        """
+        return self._finished.is_set()
+
+    def complete(self):
+        """
+        --------------------------------------------------------
+        Returns whether every guess was scored. A search that
+        was cancelled or failed only holds a partial ranking,
+        which must not be used as the result.
+        Use: finished = search.complete()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            True - The search finished on its own
+            False - It is still running, was cancelled or
+                    failed
+        --------------------------------------------------------
+        """
+        return self._finished.is_set() and self._complete
+
+    def wait(self, timeout=None):
+        """
+        --------------------------------------------------------
+        Waits for the search to stop and raises the error it
+        failed with, if any.
+        Use: finished = search.wait()
+        Use: finished = search.wait(timeout)
+        --------------------------------------------------------
+        Parameters:
+            timeout - The most seconds to wait, None to wait
+                      until it stops (float)
+        Returns:
+            True - The search has stopped
+            False - The timeout ran out first
+        --------------------------------------------------------
+        """
+        finished = self._finished.wait(timeout)
+
+        if(self._error is not None):
+            raise self._error
+
+        return finished
+
+    def progress(self):
+        """
+        --------------------------------------------------------
+        Returns how much of the search is done.
+        Use: fraction = search.progress()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The share of the guesses scored so far, from 0 to 1
+            (float)
+        --------------------------------------------------------
+        """
+        return self._scored / max(len(self._guesses), 1)
+
+    def best(self, k=None):
+        """
+        --------------------------------------------------------
+        Returns the best guesses among the ones scored so far.
+        Once the search is done this is the same as
+        Recommender.recommend.
+        Use: best = search.best()
+        Use: best = search.best(k)
+        --------------------------------------------------------
+        Parameters:
+            k - The amount of guesses, at most the k of the
+                search (int)
+        Returns:
+            A list of (guess id, entropy) pairs, best first
+            (list)
+        --------------------------------------------------------
+        """
+        k = self.k if(k is None) else min(k, self.k)
+        candidates, weights = self._effective
+
+        if(len(candidates) <= 1):
+            return [(int(x), 0.0) for x in candidates[:k]]
+
+        with self._lock:
+            bits = expand(self._bits, self._groups)
+
+        # Guesses that have not been scored yet are -inf, so they only show up when fewer than k are scored
+        return [(guess, score) for guess, score in rank(bits, candidates, weights, k) if(score > -np.inf)]
@@ -0,0 +1,551 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Server.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import argparse
+import asyncio
+import json
+import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+from Book import BOOK_FILE, OpeningBook
+from Cache import FilterCache
+from Dictionary import Dictionary
+from Engine import add_engine_arguments, load_engine
+from Guesser import Guesser
+from Patterns import PATTERNS_FILE, load_matrix
+from Recommender import Recommender
+
+MAX_BODY = 64 * 1024
+PAGE_SIZE = 100
+MAX_PAGE = 1000
+
+_REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+class HTTPError(Exception):
+
+    def __init__(self, status, message):
+        """
+        --------------------------------------------------------
+        Creates an error that is sent back to the client as a
+        JSON response.
+        Use: raise HTTPError(404, "Unknown session")
+        --------------------------------------------------------
+        Parameters:
+            status - The HTTP status code (int)
+            message - What went wrong (str)
+        Returns:
+            A new HTTPError object (HTTPError)
+        --------------------------------------------------------
+        """
+        super().__init__(message)
+        self.status = status
+
+        return
+
+
+class SessionStore:
+
+    def __init__(self, max_sessions=10000, ttl=3600, max_bytes=64 * 1024 * 1024):
+        """
+        --------------------------------------------------------
+        Creates an in-memory store of games. The store is kept
+        in least recently used order, so when it is over its
+        limits the games that were used longest ago are removed
+        first. Games that have not been used for ttl seconds
+        are removed as well.
+        Use: store = SessionStore()
+        Use: store = SessionStore(max_sessions, ttl, max_bytes)
+        --------------------------------------------------------
+        Parameters:
+            max_sessions - The most games to keep (int)
+            ttl - Seconds a game is kept after its last use,
+                  None to keep games forever (float)
+            max_bytes - The most memory the games may use (int)
+        Returns:
+            A new SessionStore object (SessionStore)
+        --------------------------------------------------------
+        """
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+        self._sessions = OrderedDict()
+        self._bytes = 0
+
+        return
+
+    def __len__(self):
+        """
+        --------------------------------------------------------
+        Returns the amount of games in the store.
+        Use: n = len(store)
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The amount of games (int)
+        --------------------------------------------------------
+        """
+        return len(self._sessions)
+
+    def add(self, guesser):
+        """
+        --------------------------------------------------------
+        Adds a game to the store and makes room for it.
+        Use: key = store.add(guesser)
+        --------------------------------------------------------
+        Parameters:
+            guesser - A new game (Guesser)
+        Returns:
+            The id of the game (str)
+        --------------------------------------------------------
+        """
+        key = secrets.token_hex(8)
+        size = guesser.nbytes()
+
+        self._sessions[key] = [guesser, size, time.monotonic()]
+        self._bytes += size
+        self._shrink()
+
+        return key
+
+    def get(self, key):
+        """
+        --------------------------------------------------------
+        Returns a game and marks it as the most recently used.
+        Use: guesser = store.get(key)
+        --------------------------------------------------------
+        Parameters:
+            key - The id of the game (str)
+        Returns:
+            The game, or None if there is no game with that id
+            (Guesser)
+        --------------------------------------------------------
+        """
+        self.expire()
+        entry = self._sessions.get(key)
+
+        if(entry is None):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        entry[2] = time.monotonic()
+        self._sessions.move_to_end(key)
+
+        return entry[0]
+
+    def update(self, key):
+        """
+        --------------------------------------------------------
+        Measures a game again after it has changed, and removes
+        other games if the store is now over its memory limit.
+        Use: store.update(key)
+        --------------------------------------------------------
+        Parameters:
+            key - The id of the game (str)
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        entry = self._sessions.get(key)
+
+        if(entry is not None):
+            size = entry[0].nbytes()
+            self._bytes += size - entry[1]
+            entry[1] = size
+            self._shrink()
+
+    def remove(self, key):
+        """
+        --------------------------------------------------------
+        Removes a game from the store.
+        Use: removed = store.remove(key)
+        --------------------------------------------------------
+        Parameters:
+            key - The id of the game (str)
+        Returns:
+            True - the game was removed
+            False - there is no game with that id
+        --------------------------------------------------------
+        """
+        entry = self._sessions.pop(key, None)
+
+        if(entry is None):
+            return False
+
+        self._bytes -= entry[1]
+
+        return True
+
+    def expire(self):
+        """
+        --------------------------------------------------------
+        Removes the games that have not been used for ttl
+        seconds. The oldest games are at the front, so this
+        stops at the first game that is still fresh.
+        Use: store.expire()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        if(self.ttl is None):
+            return
+
+        cutoff = time.monotonic() - self.ttl
+
+        while(self._sessions):
+            key, entry = next(iter(self._sessions.items()))
+            if(entry[2] > cutoff):
+                break
+            self.remove(key)
+            self.expired += 1
+
+    def _shrink(self):
+        """
+        --------------------------------------------------------
+        Removes the least recently used games until the store is
+        within its limits. The newest game is always kept.
+        Use: self._shrink()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        self.expire()
+
+        while(len(self._sessions) > 1 and (len(self._sessions) > self.max_sessions or self._bytes > self.max_bytes)):
+            key = next(iter(self._sessions))
+            self.remove(key)
+            self.evictions += 1
+
+    def stats(self):
+        """
+        --------------------------------------------------------
+        Returns the counters of the store.
+        Use: info = store.stats()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            The amount of games, their memory and the hit, miss,
+            eviction and expiry counts (dict)
+        --------------------------------------------------------
+        """
+        return {"sessions": len(self._sessions), "bytes": self._bytes, "max_sessions": self.max_sessions,
+                "max_bytes": self.max_bytes, "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "expired": self.expired}
+
+
+class SolverServer:
+
+    def __init__(self, engine, recommender, store=None, threads=None, book=None, cache=None):
+        """
+        --------------------------------------------------------
+        Creates a JSON over HTTP server for many games at once.
+        Every game shares the engine, its index, the dictionary
+        the recommender, the opening book and the filter cache,
+        so a game only holds its own history, and a state that
+        any game has reached is not filtered or searched again.
+        Recommendations run in a thread pool so they never block
+        the event loop.
+        Use: server = SolverServer(engine, recommender)
+        Use: server = SolverServer(engine, recommender, store, threads, book, cache)
+        --------------------------------------------------------
+        Parameters:
+            engine - The words to use (WordEngine)
+            recommender - Ranks the next guesses (Recommender)
+            store - Keeps the games, defaults to a new
+                    SessionStore (SessionStore)
+            threads - The amount of threads for recommendations
+                      (int)
+            book - The guesses to play in the opening, if any
+                   (OpeningBook)
+            cache - Remembers the possible words and the
+                    recommendations of each state, defaults to
+                    a new FilterCache (FilterCache)
+        Returns:
+            A new SolverServer object (SolverServer)
+        --------------------------------------------------------
+        """
+        self.engine = engine
+        self.dictionary = Dictionary(engine.packed)
+        self.recommender = recommender
+        self.store = store if(store is not None) else SessionStore()
+        self.book = book
+        self.cache = cache if(cache is not None) else FilterCache()
+        self._executor = ThreadPoolExecutor(threads)
+
+        return
+
+    def close(self):
+        """
+        --------------------------------------------------------
+        Stops the thread pool and the recommender.
+        Use: server.close()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        self._executor.shutdown()
+        self.recommender.close()
+
+    async def serve(self, host="127.0.0.1", port=8080):
+        """
+        --------------------------------------------------------
+        Answers requests until the task is cancelled.
+        Use: await server.serve(host, port)
+        --------------------------------------------------------
+        Parameters:
+            host - The address to listen on (str)
+            port - The port to listen on (int)
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        server = await asyncio.start_server(self._client, host, port)
+
+        async with server:
+            await server.serve_forever()
+
+    async def _client(self, reader, writer):
+        """
+        --------------------------------------------------------
+        Reads the requests of one connection and writes the
+        responses. The connection is kept open between requests
+        unless the client asks to close it.
+        Use: await self._client(reader, writer)
+        --------------------------------------------------------
+        Parameters:
+            reader - The incoming data (asyncio.StreamReader)
+            writer - The outgoing data (asyncio.StreamWriter)
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        try:
+            while(True):
+                line = await reader.readline()
+                if(not line.strip()):
+                    break
+
+                parts = line.decode("latin-1").split()
+                headers = {}
+
+                while(True):
+                    header = await reader.readline()
+                    if(header in (b"\r\n", b"\n", b"")):
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                try:
+                    if(len(parts) != 3):
+                        raise HTTPError(400, "Invalid request line")
+
+                    length = int(headers.get("content-length", 0))
+                    if(length > MAX_BODY):
+                        keep_alive = False
+                        raise HTTPError(413, "Request body is too large")
+
+                    body = await reader.readexactly(length) if(length) else b""
+                    status, data = await self._route(parts[0], parts[1], body)
+                except HTTPError as e:
+                    status, data = e.status, {"error": str(e)}
+                except ValueError as e:
+                    status, data = 400, {"error": str(e)}
+                except Exception as e:
+                    status, data = 500, {"error": repr(e)}
+
+                payload = json.dumps(data).encode("utf-8")
+                writer.write("HTTP/1.1 {:} {:}\r\nContent-Type: application/json\r\nContent-Length: {:}\r\nConnection: {:}\r\n\r\n".format(
+                    status, _REASONS.get(status, ""), len(payload), "keep-alive" if(keep_alive) else "close").encode("latin-1") + payload)
+                await writer.drain()
+
+                if(not keep_alive):
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _session(self, key):
+        """
+        --------------------------------------------------------
+        Returns a game or raises a 404 error.
+        Use: guesser = self._session(key)
+        --------------------------------------------------------
+        Parameters:
+            key - The id of the game (str)
+        Returns:
+            The game (Guesser)
+        --------------------------------------------------------
+        """
+        guesser = self.store.get(key)
+
+        if(guesser is None):
+            raise HTTPError(404, "Unknown session: {:}".format(key))
+
+        return guesser
+
+    async def _route(self, method, target, body):
+        """
+        --------------------------------------------------------
+        Answers one request.
+        Use: status, data = await self._route(method, target, body)
+        --------------------------------------------------------
+        Parameters:
+            method - The HTTP method (str)
+            target - The path and query of the request (str)
+            body - The request body (bytes)
+        Returns:
+            The status code and the JSON data to send (tuple)
+        --------------------------------------------------------
+        """
+        url = urlsplit(target)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        path = [part for part in url.path.split("/") if(part)]
+        data = json.loads(body) if(body) else {}
+
+        if(not isinstance(data, dict)):
+            raise ValueError("The request body must be a JSON object")
+
+        if(path == ["stats"] and method == "GET"):
+            return 200, dict(self.store.stats(), cache=self.cache.stats())
+
+        if(path == ["sessions"] and method == "POST"):
+            if("state" in data):
+                if(not isinstance(data["state"], str)):
+                    raise ValueError("state must be the saved game as hex")
+                guesser = Guesser.resume(bytes.fromhex(data["state"]), self.engine, self.recommender, self.dictionary,
+                                         self.book, self.cache)
+            else:
+                guesser = Guesser(self.engine, self.recommender, self.dictionary, self.book, self.cache)
+            return 201, {"id": self.store.add(guesser), "remaining": len(guesser)}
+
+        if(len(path) < 2 or path[0] != "sessions"):
+            raise HTTPError(404, "Unknown path: {:}".format(url.path))
+
+        key = path[1]
+        action = path[2] if(len(path) == 3) else None
+
+        if(len(path) > 3):
+            raise HTTPError(404, "Unknown path: {:}".format(url.path))
+
+        if(action is None and method == "DELETE"):
+            if(not self.store.remove(key)):
+                raise HTTPError(404, "Unknown session: {:}".format(key))
+            return 200, {"id": key}
+
+        if(action is None and method == "GET"):
+            guesser = self._session(key)
+            return 200, {"id": key, "remaining": len(guesser),
+                         "guesses": [[guess, code] for guess, code in guesser.guesses()]}
+
+        if(action == "feedback" and method == "POST"):
+            guesser = self._session(key)
+            pattern = data.get("pattern")
+            # JSON true and false are ints to Python, but not patterns
+            if(not isinstance(data.get("guess"), str) or isinstance(pattern, bool)
+               or not isinstance(pattern, (str, int))):
+                raise ValueError("feedback needs a guess and a pattern")
+            remaining = guesser.apply_feedback(data["guess"], data["pattern"])
+            self.store.update(key)
+            return 200, {"id": key, "remaining": remaining}
+
+        if(action == "undo" and method == "POST"):
+            guesser = self._session(key)
+            undone = guesser.undo()
+            self.store.update(key)
+            return 200, {"id": key, "undone": undone, "remaining": len(guesser)}
+
+        if(action == "state" and method == "GET"):
+            return 200, {"id": key, "state": self._session(key).save().hex()}
+
+        if(action == "candidates" and method == "GET"):
+            guesser = self._session(key)
+            offset = max(int(query.get("offset", 0)), 0)
+            limit = min(max(int(query.get("limit", PAGE_SIZE)), 0), MAX_PAGE)
+            return 200, {"total": len(guesser), "offset": offset, "words": list(guesser.candidates(offset, limit))}
+
+        if(action == "recommend" and method == "GET"):
+            guesser = self._session(key)
+            k = min(max(int(query.get("k", 10)), 1), MAX_PAGE)
+            loop = asyncio.get_running_loop()
+            best = await loop.run_in_executor(self._executor, guesser.recommend, k)
+            return 200, {"remaining": len(guesser), "guesses": [[word, bits] for word, bits in best]}
+
+        raise HTTPError(405 if(action in (None, "feedback", "undo", "state", "candidates", "recommend")) else 404,
+                        "{:} is not supported for {:}".format(method, url.path))
+
+
+def main():
+    """
+    --------------------------------------------------------
+    Starts the solver server from the command line.
+    Use: python Server.py
+    Use: python Server.py --port 8080 --max-sessions 1000
+    --------------------------------------------------------
+    Parameters:
+        None
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    parser = argparse.ArgumentParser(description="Serves Wordle games over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    parser.add_argument("--max-sessions", type=int, default=10000, help="most games kept in memory")
+    parser.add_argument("--ttl", type=float, default=3600, help="seconds a game is kept after its last use")
+    parser.add_argument("--memory-mb", type=float, default=64, help="most memory the games may use")
+    parser.add_argument("--workers", type=int, default=None, help="processes used for recommendations")
+    parser.add_argument("--book", default=BOOK_FILE, help="opening book to use if it exists (see Book.py)")
+    parser.add_argument("--cache-entries", type=int, default=4096, help="most game states kept in the filter cache")
+    parser.add_argument("--cache-mb", type=float, default=32, help="most memory the filter cache may use")
+    parser.add_argument("--matrix-memory-mb", type=float, help="most megabytes of patterns to hold at once, "
+                                                               "computing them in tiles if the full matrix is larger")
+    add_engine_arguments(parser)
+    args = parser.parse_args()
+
+    engine = load_engine(parser, args)
+    memory = None if(args.matrix_memory_mb is None) else int(args.matrix_memory_mb * 1024 * 1024)
+    recommender = Recommender(load_matrix(engine, PATTERNS_FILE, memory), args.workers, weights=engine.weights)
+    store = SessionStore(args.max_sessions, args.ttl, int(args.memory_mb * 1024 * 1024))
+    cache = FilterCache(args.cache_entries, int(args.cache_mb * 1024 * 1024))
+    server = SolverServer(engine, recommender, store, book=OpeningBook.load(args.book, engine), cache=cache)
+
+    print("Serving on http://{:}:{:}".format(args.host, args.port))
+
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if(__name__ == "__main__"):
+    main()
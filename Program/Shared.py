@@ -0,0 +1,170 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Shared.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import weakref
+from multiprocessing import shared_memory
+import numpy as np
+
+# The blocks a worker process has attached to, kept open until the worker exits
+_attached = []
+
+def _release(blocks):
+    """
+    --------------------------------------------------------
+    Closes and removes shared memory blocks. A block that
+    still has arrays pointing into it can not be closed yet,
+    but it is still removed, so the memory is freed as soon
+    as those arrays are gone.
+    Use: _release(blocks)
+    --------------------------------------------------------
+    Parameters:
+        blocks - The blocks to remove (SharedMemory[])
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            pass
+
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+    blocks.clear()
+
+
+def attach(spec):
+    """
+    --------------------------------------------------------
+    Opens the arrays of a SharedArrays object inside another
+    process. Nothing is copied: the arrays point straight
+    into the shared blocks.
+    Use: arrays = attach(spec)
+    --------------------------------------------------------
+    Parameters:
+        spec - The spec of a SharedArrays object (dict)
+    Returns:
+        A dictionary from name to array (dict)
+    --------------------------------------------------------
+    """
+    arrays = {}
+
+    for name, (block_name, shape, dtype) in spec.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        _attached.append(block)
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+    return arrays
+
+
+class SharedArrays:
+
+    def __init__(self, arrays):
+        """
+        --------------------------------------------------------
+        Copies arrays into shared memory blocks so worker
+        processes can read them without pickling. Only the
+        spec, a few names and shapes, is sent to the workers,
+        which open the blocks with attach. The blocks are
+        removed by close, when the object is garbage collected,
+        or when the program exits. If the program is killed,
+        the multiprocessing resource tracker removes them.
+        Use: shared = SharedArrays({"codes": codes, "counts": counts})
+        --------------------------------------------------------
+        Parameters:
+            arrays - A dictionary from name to array (dict)
+        Returns:
+            A new SharedArrays object (SharedArrays)
+        --------------------------------------------------------
+        """
+        self.spec = {}
+        self._arrays = {}
+        self._blocks = []
+        self._finalizer = weakref.finalize(self, _release, self._blocks)
+
+        for name, array in arrays.items():
+            array = np.asarray(array)
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            self._blocks.append(block)
+
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            view[...] = array
+
+            self._arrays[name] = view
+            self.spec[name] = (block.name, array.shape, array.dtype.str)
+
+        return
+
+    def __getitem__(self, name):
+        """
+        --------------------------------------------------------
+        Returns one of the shared arrays. Writing to it changes
+        what the workers see.
+        Use: array = shared[name]
+        --------------------------------------------------------
+        Parameters:
+            name - The name of the array (str)
+        Returns:
+            The shared array (np.ndarray)
+        --------------------------------------------------------
+        """
+        return self._arrays[name]
+
+    def __enter__(self):
+        """
+        --------------------------------------------------------
+        Allows SharedArrays to be used in a with statement.
+        Use: with SharedArrays(arrays) as shared
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            This object (SharedArrays)
+        --------------------------------------------------------
+        """
+        return self
+
+    def __exit__(self, kind, value, traceback):
+        """
+        --------------------------------------------------------
+        Removes the blocks at the end of a with statement, even
+        if it was left by an exception.
+        Use: with SharedArrays(arrays) as shared
+        --------------------------------------------------------
+        Parameters:
+            kind, value, traceback - The exception, if any
+        Returns:
+            False, so exceptions are not hidden (bool)
+        --------------------------------------------------------
+        """
+        self.close()
+
+        return False
+
+    def close(self):
+        """
+        --------------------------------------------------------
+        Removes the shared blocks. The arrays of this object
+        can not be used afterwards. Calling close again does
+        nothing.
+        Use: shared.close()
+        --------------------------------------------------------
+        Parameters:
+            None
+        Returns:
+            None
+        --------------------------------------------------------
+        """
+        self._arrays.clear()
+        self._finalizer()
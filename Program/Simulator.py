@@ -0,0 +1,363 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Simulator.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import argparse
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from Engine import add_engine_arguments, load_engine, read_words
+from Patterns import ALL_GREEN, PATTERNS_FILE, attach_matrix, load_matrix
+from Recommender import Recommender, effective, score_rows
+from Shared import SharedArrays, attach
+
+GUESSES = 6
+MAX_TURNS = 20
+SHOWN_FAILURES = 50
+
+# The pattern matrix, targets, candidates and strategy of a worker process, set once by _init_worker
+_worker_matrix = None
+_worker_targets = None
+_worker_candidates = None
+_worker_strategy = None
+
+class FirstCandidate:
+
+    def __call__(self, matrix, candidates, history):
+        """
+        --------------------------------------------------------
+        Always plays the first remaining candidate.
+        Use: guess = s(matrix, candidates, history)
+        --------------------------------------------------------
+        Parameters:
+            matrix - The guess by answer patterns (PatternMatrix
+                     or TiledMatrix)
+            candidates - The ids of the remaining words
+                         (np.ndarray)
+            history - The (guess, pattern) pairs played so far
+                      (tuple)
+        Returns:
+            The id of the next guess (int)
+        --------------------------------------------------------
+        """
+        return int(candidates[0])
+
+
+class MostInformation:
+
+    def __init__(self, opener=None, weights=None):
+        """
+        --------------------------------------------------------
+        Creates a strategy that plays the guess with the highest
+        entropy. Every game that reaches the same state plays the
+        same guess, so the choice is remembered by the patterns
+        seen so far and each state is only scored once per
+        process.
+        Use: s = MostInformation()
+        Use: s = MostInformation(opener, weights)
+        --------------------------------------------------------
+        Parameters:
+            opener - The id of the first guess. If None it is
+                     scored like any other turn (int)
+            weights - The prior weight of every word id, or None
+                      if every word is as likely (np.ndarray)
+        Returns:
+            A new MostInformation object (MostInformation)
+        --------------------------------------------------------
+        """
+        self._memo = {}
+        self._weights = weights
+
+        if(opener is not None):
+            self._memo[()] = opener
+
+        return
+
+    def __call__(self, matrix, candidates, history):
+        """
+        --------------------------------------------------------
+        Returns the guess with the most expected information.
+        When only one or two likely words remain, the most
+        likely one is played instead.
+        Use: guess = s(matrix, candidates, history)
+        --------------------------------------------------------
+        Parameters:
+            matrix - The guess by answer patterns (PatternMatrix
+                     or TiledMatrix)
+            candidates - The ids of the remaining words
+                         (np.ndarray)
+            history - The (guess, pattern) pairs played so far
+                      (tuple)
+        Returns:
+            The id of the next guess (int)
+        --------------------------------------------------------
+        """
+        key = tuple(pattern for guess, pattern in history)
+
+        if(key not in self._memo):
+            candidates, weights = effective(candidates, self._weights)
+
+            if(len(candidates) <= 2):
+                self._memo[key] = int(candidates[0] if(weights is None) else candidates[np.argmax(weights)])
+            else:
+                bits = score_rows(matrix, 0, len(matrix), candidates, weights)
+                possible = np.zeros(len(bits), dtype=bool)
+                possible[candidates] = True
+                self._memo[key] = int(np.lexsort((~possible, -bits))[0])
+
+        return self._memo[key]
+
+
+STRATEGIES = {"entropy": MostInformation, "first": FirstCandidate}
+
+def play_game(matrix, strategy, target, candidates):
+    """
+    --------------------------------------------------------
+    Plays one game without any input. The feedback for each
+    guess is read from the pattern matrix.
+    Use: turns = play_game(matrix, strategy, target, candidates)
+    --------------------------------------------------------
+    Parameters:
+        matrix - The guess by answer patterns (PatternMatrix
+                 or TiledMatrix)
+        strategy - Chooses each guess (callable)
+        target - The id of the answer (int)
+        candidates - The ids of the words the answer could be
+                     (np.ndarray)
+    Returns:
+        The amount of guesses used, or 0 if the game was not
+        solved within MAX_TURNS (int)
+    --------------------------------------------------------
+    """
+    history = ()
+
+    for turn in range(1, MAX_TURNS + 1):
+        guess = strategy(matrix, candidates, history)
+        pattern = int(matrix[guess, target])
+
+        if(pattern == ALL_GREEN):
+            return turn
+
+        candidates = candidates[matrix[guess, candidates] == pattern]
+        history += ((guess, pattern),)
+
+    return 0
+
+
+def _init_worker(spec, info, strategy):
+    """
+    --------------------------------------------------------
+    Opens the pattern matrix, the shared targets and the
+    shared candidates and stores the strategy inside a
+    worker process.
+    Use: _init_worker(spec, info, strategy)
+    --------------------------------------------------------
+    Parameters:
+        spec - The spec of the shared arrays (dict)
+        info - How to open the matrix (tuple)
+        strategy - Chooses each guess (callable)
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    global _worker_matrix, _worker_targets, _worker_candidates, _worker_strategy
+    arrays = attach(spec)
+    _worker_targets = arrays["targets"]
+    _worker_candidates = arrays["candidates"]
+    _worker_strategy = strategy
+    _worker_matrix = attach_matrix(arrays, info)
+
+
+def _play_games(start, stop):
+    """
+    --------------------------------------------------------
+    Plays a game for the shared targets start to stop inside
+    a worker process. Only the shared candidates can be the
+    answer.
+    Use: turns = _play_games(start, stop)
+    --------------------------------------------------------
+    Parameters:
+        start - The index of the first target (int)
+        stop - The index after the last target (int)
+    Returns:
+        The amount of guesses used for each game (int[])
+    --------------------------------------------------------
+    """
+    return [play_game(_worker_matrix, _worker_strategy, int(target), _worker_candidates)
+            for target in _worker_targets[start:stop]]
+
+
+def simulate(matrix, strategy, targets, workers=None, share_matrix=False, candidates=None):
+    """
+    --------------------------------------------------------
+    Plays a full game against every target, split over a
+    process pool. The targets are put in shared memory (see
+    Shared.py), so a task only sends a range of targets.
+    Use: results = simulate(matrix, strategy, targets)
+    Use: results = simulate(matrix, strategy, targets, workers, share_matrix, candidates)
+    --------------------------------------------------------
+    Parameters:
+        matrix - The guess by answer patterns (PatternMatrix
+                 or TiledMatrix)
+        strategy - Chooses each guess (callable)
+        targets - The ids of the answers (np.ndarray)
+        workers - The amount of processes to use, defaults to
+                  the amount of CPUs (int)
+        share_matrix - Copies the matrix into shared memory
+                       instead of memory-mapping its file in
+                       every worker (bool)
+        candidates - The ids of the words that can be the
+                     answer, defaults to every word (np.ndarray)
+    Returns:
+        A dictionary with the amount of guesses used for each
+        target ("turns"), and the time it took ("seconds")
+        (dict)
+    --------------------------------------------------------
+    """
+    cols = matrix.shape[1]
+    workers = workers or os.cpu_count() or 1
+    targets = np.asarray(targets, dtype=np.int32)
+    candidates = np.arange(cols, dtype=np.int32) if(candidates is None) else np.asarray(candidates, dtype=np.int32)
+    start = time.perf_counter()
+
+    if(workers == 1):
+        turns = [play_game(matrix, strategy, int(target), candidates) for target in targets]
+    else:
+        arrays, info = matrix.share(share_matrix, workers)
+        arrays["targets"] = targets
+        arrays["candidates"] = candidates
+
+        size = max(1, -(-len(targets) // (workers * 8)))
+
+        with SharedArrays(arrays) as shared:
+            pool = ProcessPoolExecutor(workers, initializer=_init_worker,
+                                       initargs=(shared.spec, info, strategy))
+            try:
+                futures = [pool.submit(_play_games, x, x + size) for x in range(0, len(targets), size)]
+                turns = [x for future in futures for x in future.result()]
+            finally:
+                pool.shutdown()
+
+    return {"turns": turns, "seconds": time.perf_counter() - start}
+
+
+def report(engine, targets, results):
+    """
+    --------------------------------------------------------
+    Returns the guess distribution, the failures and the
+    speed of a simulation.
+    Use: print(report(engine, targets, results))
+    --------------------------------------------------------
+    Parameters:
+        engine - The words (WordEngine)
+        targets - The ids of the answers (np.ndarray)
+        results - The output of simulate (dict)
+    Returns:
+        A formatted report (str)
+    --------------------------------------------------------
+    """
+    turns = results["turns"]
+    solved = [x for x in turns if(0 < x <= GUESSES)]
+    failures = [engine.words[target] for target, x in zip(targets, turns) if(x == 0 or x > GUESSES)]
+    distribution = Counter(x for x in turns if(x > 0))
+
+    output = "{:} games, {:} solved, {:} failed\n".format(len(turns), len(solved), len(failures))
+
+    for x in sorted(distribution):
+        output += "{:>3}: {:>6}  {:}\n".format(x, distribution[x], "#" * (60 * distribution[x] // len(turns)))
+
+    if(solved):
+        output += "Average guesses: {:.4f}\n".format(sum(solved) / len(solved))
+    if(failures):
+        output += "Failures: {:}".format(" ".join(failures[:SHOWN_FAILURES]))
+        if(len(failures) > SHOWN_FAILURES):
+            output += " (+{:} more)".format(len(failures) - SHOWN_FAILURES)
+        output += "\n"
+
+    output += "{:.1f} games per second ({:.2f} s)".format(len(turns) / results["seconds"], results["seconds"])
+
+    return output
+
+
+def main():
+    """
+    --------------------------------------------------------
+    Runs a simulation from the command line.
+    Use: python Simulator.py --strategy entropy --opener tares
+    --------------------------------------------------------
+    Parameters:
+        None
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    parser = argparse.ArgumentParser(description="Plays a game against every target word.")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="entropy")
+    parser.add_argument("--opener", help="first guess of the entropy strategy")
+    parser.add_argument("--targets", help="comma or line separated file of target words "
+                                          "(default: the possible answers, or every word with a prior weight "
+                                          "when every word can be the answer)")
+    parser.add_argument("--limit", type=int, help="only play the first LIMIT targets")
+    parser.add_argument("--workers", type=int, help="amount of processes (default: one per CPU)")
+    parser.add_argument("--share-matrix", action="store_true",
+                        help="copy the pattern matrix into shared memory instead of memory-mapping it in each worker")
+    parser.add_argument("--memory", type=float, help="most megabytes of patterns to hold at once, "
+                                                     "computing them in tiles if the full matrix is larger")
+    parser.add_argument("--spill", help="file that keeps the computed tiles in tiled mode")
+    parser.add_argument("--uniform", action="store_true", help="ignore the prior weights of the words")
+    add_engine_arguments(parser)
+    args = parser.parse_args()
+
+    engine = load_engine(parser, args)
+    weights = None if(args.uniform) else engine.weights
+    memory = None if(args.memory is None) else int(args.memory * 1024 * 1024)
+    matrix = load_matrix(engine, PATTERNS_FILE, memory, args.spill)
+
+    if(args.targets):
+        try:
+            targets = engine.find_all(read_words(args.targets))
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+
+        outside = targets[~np.isin(targets, engine.candidate_ids())]
+
+        if(len(outside)):
+            parser.error("Not in the answer list: {:} (use --candidates all to play them)".format(
+                ", ".join(engine.words[int(x)] for x in outside)))
+    elif(engine.answers is not None):
+        targets = engine.answers
+    elif(weights is not None):
+        targets = np.flatnonzero(weights > 0).astype(np.int32)
+    else:
+        targets = engine.all_ids()
+
+    targets = targets[:args.limit]
+
+    if(args.strategy == "entropy"):
+        if(args.opener):
+            opener = engine.find(args.opener.lower())
+            if(opener < 0):
+                parser.error("{:} is not in the word list".format(args.opener))
+        else:
+            recommender = Recommender(matrix, args.workers, weights=weights)
+            opener = recommender.recommend(engine.candidate_ids(), 1)[0][0]
+            recommender.close()
+        strategy = MostInformation(opener, weights)
+        print("Opener: {:}".format(engine.words[opener]))
+    else:
+        strategy = FirstCandidate()
+
+    print(report(engine, targets, simulate(matrix, strategy, targets, args.workers, args.share_matrix,
+                                           engine.candidate_ids())))
+
+
+if(__name__ == "__main__"):
+    main()
@@ -0,0 +1,164 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Snapshot.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import hashlib
+import os
+import sys
+import numpy as np
+from Packed import pack
+
+WORD_LENGTH = 5
+
+_MAGIC = b"WGWS"
+_VERSION = 2
+_HEADER = np.dtype([("magic", "S4"), ("version", "<u4"), ("count", "<u4"), ("width", "<u4"),
+                    ("source_size", "<u8"), ("source_mtime", "<u8"), ("digest", "u1", (32,))])
+
+def snapshot_name(words_file):
+    """
+    --------------------------------------------------------
+    Returns the name of the snapshot that belongs to a word
+    list.
+    Use: filename = snapshot_name(words_file)
+    --------------------------------------------------------
+    Parameters:
+        words_file - The path of the word list (str)
+    Returns:
+        The path of the snapshot (str)
+    --------------------------------------------------------
+    """
+    return os.path.splitext(words_file)[0] + ".bin"
+
+
+def encode_words(words):
+    """
+    --------------------------------------------------------
+    Sorts a list of words, removes the duplicates and turns
+    them into letter codes (0 - 25).
+    Use: codes = encode_words(words)
+    --------------------------------------------------------
+    Parameters:
+        words - A list of five letter words (str[])
+    Returns:
+        An (N, 5) array of letter codes (np.ndarray)
+    --------------------------------------------------------
+    """
+    words = sorted(set(word.strip().lower() for word in words if(word.strip())))
+
+    for word in words:
+        if(len(word) != WORD_LENGTH or not word.isalpha() or not word.isascii()):
+            raise ValueError("Invalid word: {:}".format(word))
+
+    text = "".join(words).encode("ascii")
+
+    return (np.frombuffer(text, dtype=np.uint8) - ord("a")).reshape(-1, WORD_LENGTH)
+
+
+def digest(codes):
+    """
+    --------------------------------------------------------
+    Returns a hash of a word list. Files built from the words
+    store it so they can tell when the word list has changed.
+    Use: d = digest(codes)
+    --------------------------------------------------------
+    Parameters:
+        codes - An (N, 5) array of letter codes (np.ndarray)
+    Returns:
+        The SHA-256 digest of the letter codes (bytes)
+    --------------------------------------------------------
+    """
+    return hashlib.sha256(np.ascontiguousarray(codes, dtype=np.uint8).tobytes()).digest()
+
+
+def build_snapshot(words_file, filename=None):
+    """
+    --------------------------------------------------------
+    Compiles a comma separated word list into a snapshot. The
+    snapshot is a fixed size header followed by the sorted
+    words, packed into 4 bytes each (see Packed.py). The
+    header remembers the size and
+    modification time of the word list so a stale snapshot
+    can be found without reading the words again.
+    Use: filename = build_snapshot(words_file)
+    --------------------------------------------------------
+    Parameters:
+        words_file - The path of the word list (str)
+        filename - The path of the snapshot, defaults to the
+                   word list with a .bin extension (str)
+    Returns:
+        The path of the snapshot (str)
+    --------------------------------------------------------
+    """
+    if(filename is None):
+        filename = snapshot_name(words_file)
+
+    f = open(words_file, "r")
+    codes = encode_words(f.read().split(","))
+    f.close()
+
+    stat = os.stat(words_file)
+    header = np.zeros(1, dtype=_HEADER)
+    header[0] = (_MAGIC, _VERSION, len(codes), WORD_LENGTH, stat.st_size, stat.st_mtime_ns,
+                 np.frombuffer(digest(codes), dtype=np.uint8))
+
+    temp = filename + ".tmp"
+    f = open(temp, "wb")
+    f.write(header.tobytes())
+    f.write(pack(codes).astype("<u4").tobytes())
+    f.close()
+    os.replace(temp, filename)
+
+    return filename
+
+
+def open_snapshot(filename, words_file=None):
+    """
+    --------------------------------------------------------
+    Memory-maps the packed words of a snapshot.
+    Use: packed, d = open_snapshot(filename)
+    Use: packed, d = open_snapshot(filename, words_file)
+    --------------------------------------------------------
+    Parameters:
+        filename - The path of the snapshot (str)
+        words_file - If given, the snapshot is only used if it
+                     was built from this word list as it is
+                     now (str)
+    Returns:
+        The memory-mapped, read-only packed words (see
+        Packed.py) and the digest of the words, or None if the
+        snapshot can not be used (tuple or None)
+    --------------------------------------------------------
+    """
+    if(not os.path.exists(filename) or os.path.getsize(filename) < _HEADER.itemsize):
+        return None
+
+    header = np.fromfile(filename, dtype=_HEADER, count=1)[0]
+
+    if(header["magic"] != _MAGIC or header["version"] != _VERSION or header["width"] != WORD_LENGTH):
+        return None
+
+    if(os.path.getsize(filename) != _HEADER.itemsize + int(header["count"]) * 4):
+        return None
+
+    if(words_file is not None and os.path.exists(words_file)):
+        stat = os.stat(words_file)
+        if(header["source_size"] != stat.st_size or header["source_mtime"] != stat.st_mtime_ns):
+            return None
+
+    packed = np.memmap(filename, dtype="<u4", mode="r", offset=_HEADER.itemsize, shape=(int(header["count"]),))
+
+    return packed, header["digest"].tobytes()
+
+
+if(__name__ == "__main__"):
+    if(len(sys.argv) < 2):
+        print("Use: python Snapshot.py words.txt [snapshot.bin]")
+    else:
+        print("Wrote {:}".format(build_snapshot(sys.argv[1], sys.argv[2] if(len(sys.argv) > 2) else None)))
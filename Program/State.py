@@ -0,0 +1,104 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  State.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import numpy as np
+from Constraints import ALPHABET, WORD_LENGTH, Constraints
+
+MAX_HISTORY = 8
+# Guess ids are stored in 2 bytes and the largest value marks an unused slot
+MAX_WORDS = 0xFFFF
+
+_MAGIC = b"WG"
+_VERSION = 2
+_DIGEST_BYTES = 8
+_NO_GUESS = MAX_WORDS
+_STATE = np.dtype([("magic", "S2"), ("version", "u1"), ("turns", "u1"), ("digest", "u1", (_DIGEST_BYTES,)),
+                   ("allowed", "<u4", (WORD_LENGTH,)), ("counts", "u1", (len(ALPHABET),)),
+                   ("guesses", "<u2", (MAX_HISTORY,)), ("patterns", "u1", (MAX_HISTORY,))])
+
+STATE_SIZE = _STATE.itemsize
+
+def encode_state(constraints, guesses, word_digest):
+    """
+    --------------------------------------------------------
+    Packs the state of a game into a fixed size record. The
+    record holds the allowed letters of each position, the
+    min and max count of each letter in one byte, and the id
+    and pattern code of every guess. The possible words are
+    not stored: they can be filtered again from the guesses.
+    Only word lists of up to MAX_WORDS words can be saved.
+    Use: data = encode_state(constraints, guesses, word_digest)
+    --------------------------------------------------------
+    Parameters:
+        constraints - The constraints of the latest turn
+                      (Constraints)
+        guesses - The (word id, pattern code) of every guess,
+                  oldest first (list)
+        word_digest - The digest of the word list the ids
+                      belong to (bytes)
+    Returns:
+        The record, STATE_SIZE bytes long (bytes)
+    --------------------------------------------------------
+    """
+    if(len(guesses) > MAX_HISTORY):
+        raise ValueError("Only {:} guesses can be saved".format(MAX_HISTORY))
+
+    record = np.zeros(1, dtype=_STATE)[0]
+    record["magic"] = _MAGIC
+    record["version"] = _VERSION
+    record["turns"] = len(guesses)
+    record["digest"] = np.frombuffer(word_digest[:_DIGEST_BYTES], dtype=np.uint8)
+    record["allowed"] = constraints.allowed
+    record["counts"] = [low * (WORD_LENGTH + 1) + high for low, high in zip(constraints.minimum, constraints.maximum)]
+    record["guesses"] = _NO_GUESS
+
+    for i, (word_id, code) in enumerate(guesses):
+        if(not 0 <= word_id < MAX_WORDS):
+            raise ValueError("Saved games only hold word lists of up to {:,} words".format(MAX_WORDS))
+
+        record["guesses"][i] = word_id
+        record["patterns"][i] = code
+
+    return record.tobytes()
+
+
+def decode_state(data, word_digest):
+    """
+    --------------------------------------------------------
+    Unpacks a record made by encode_state.
+    Use: constraints, guesses = decode_state(data, word_digest)
+    --------------------------------------------------------
+    Parameters:
+        data - The record (bytes)
+        word_digest - The digest of the word list the record
+                      will be used with (bytes)
+    Returns:
+        The constraints of the latest turn and the (word id,
+        pattern code) of every guess (tuple)
+    --------------------------------------------------------
+    """
+    if(len(data) != STATE_SIZE):
+        raise ValueError("A saved game is {:} bytes, not {:}".format(STATE_SIZE, len(data)))
+
+    record = np.frombuffer(data, dtype=_STATE)[0]
+
+    if(record["magic"] != _MAGIC or record["version"] != _VERSION or record["turns"] > MAX_HISTORY):
+        raise ValueError("Not a saved game")
+
+    if(record["digest"].tobytes() != word_digest[:_DIGEST_BYTES]):
+        raise ValueError("The saved game was made with a different word list")
+
+    counts = [divmod(int(x), WORD_LENGTH + 1) for x in record["counts"]]
+    constraints = Constraints([int(x) for x in record["allowed"]], [low for low, high in counts],
+                              [high for low, high in counts])
+    turns = int(record["turns"])
+    guesses = [(int(x), int(y)) for x, y in zip(record["guesses"][:turns], record["patterns"][:turns])]
+
+    return constraints, guesses
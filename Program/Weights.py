@@ -0,0 +1,195 @@
+"""
+--------------------------------------------------------
+Title:      Wordle Guesser
+File Name:  Weights.py
+Author:     Matt McBurnie
+Version:    1.0.0
+Date:       October 18, 2026
+--------------------------------------------------------
+"""
+
+import argparse
+import os
+import numpy as np
+
+FLOATS = 0
+FLAGS = 1
+
+_MAGIC = b"WGPW"
+_VERSION = 1
+_HEADER = np.dtype([("magic", "S4"), ("version", "<u4"), ("digest", "u1", (32,)), ("count", "<u4"),
+                    ("kind", "<u4")])
+
+def weights_name(words_file):
+    """
+    --------------------------------------------------------
+    Returns the name of the weights file that belongs to a
+    word list.
+    Use: filename = weights_name(words_file)
+    --------------------------------------------------------
+    Parameters:
+        words_file - The path of the word list (str)
+    Returns:
+        The path of the weights file (str)
+    --------------------------------------------------------
+    """
+    return os.path.splitext(words_file)[0] + ".weights"
+
+
+def save_weights(filename, weights, word_digest):
+    """
+    --------------------------------------------------------
+    Writes the prior weight of every word, in word id order.
+    If every weight is 0 or 1 the weights are stored as one
+    bit per word (answer or guess only), otherwise as 4 byte
+    floats.
+    Use: save_weights(filename, weights, word_digest)
+    --------------------------------------------------------
+    Parameters:
+        filename - The path of the weights file (str)
+        weights - One weight per word id (np.ndarray)
+        word_digest - The digest of the word list (bytes)
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    weights = np.asarray(weights, dtype=np.float32)
+
+    if(np.any(weights < 0) or not np.all(np.isfinite(weights))):
+        raise ValueError("Weights must be finite and not negative")
+
+    kind = FLAGS if(np.all((weights == 0) | (weights == 1))) else FLOATS
+
+    header = np.zeros(1, dtype=_HEADER)
+    header[0] = (_MAGIC, _VERSION, np.frombuffer(word_digest, dtype=np.uint8), len(weights), kind)
+
+    temp = filename + ".tmp"
+    f = open(temp, "wb")
+    f.write(header.tobytes())
+
+    if(kind == FLAGS):
+        f.write(np.packbits(weights == 1, bitorder="little").tobytes())
+    else:
+        f.write(weights.astype("<f4").tobytes())
+
+    f.close()
+    os.replace(temp, filename)
+
+    return
+
+
+def load_weights(filename, engine):
+    """
+    --------------------------------------------------------
+    Reads a weights file made by save_weights.
+    Use: weights = load_weights(filename, engine)
+    --------------------------------------------------------
+    Parameters:
+        filename - The path of the weights file (str)
+        engine - The words the weights belong to (WordEngine)
+    Returns:
+        A read-only float32 array with one weight per word
+        id, or None if the file is missing or was made for a
+        different word list (np.ndarray)
+    --------------------------------------------------------
+    """
+    if(not os.path.exists(filename) or os.path.getsize(filename) < _HEADER.itemsize):
+        return None
+
+    f = open(filename, "rb")
+    header = np.frombuffer(f.read(_HEADER.itemsize), dtype=_HEADER)[0]
+    data = f.read()
+    f.close()
+
+    if(header["magic"] != _MAGIC or header["version"] != _VERSION or header["count"] != len(engine)
+       or header["digest"].tobytes() != engine.digest()):
+        return None
+
+    if(header["kind"] == FLAGS):
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=len(engine), bitorder="little")
+        weights = bits.astype(np.float32)
+    else:
+        weights = np.frombuffer(data, dtype="<f4", count=len(engine)).astype(np.float32)
+
+    weights.flags.writeable = False
+
+    return weights
+
+
+def read_weights(engine, filename, floor=0.0, first=None):
+    """
+    --------------------------------------------------------
+    Builds weights from a text file. The file can be a
+    comma or whitespace separated list of words, which get a
+    weight of 1, or one "word weight" pair per line. If first
+    is given, only the first words of the file, in the order
+    they are written, are used. Words that are not in the
+    file get the floor weight, and words that are not in the
+    word list are skipped.
+    Use: weights = read_weights(engine, filename)
+    Use: weights = read_weights(engine, filename, floor, first)
+    --------------------------------------------------------
+    Parameters:
+        engine - The words to weigh (WordEngine)
+        filename - The path of the text file (str)
+        floor - The weight of the words not in the file
+                (float)
+        first - Only use this many words of the file (int)
+    Returns:
+        One weight per word id (np.ndarray)
+    --------------------------------------------------------
+    """
+    weights = np.full(len(engine), floor, dtype=np.float32)
+
+    f = open(filename, "r")
+    lines = f.read().replace(",", "\n").split("\n")
+    f.close()
+
+    entries = [line.split() for line in lines if(line.strip())]
+
+    if(first is not None):
+        entries = entries[:first]
+
+    for entry in entries:
+        word_id = engine.find(entry[0].lower())
+        if(word_id >= 0):
+            weights[word_id] = float(entry[1]) if(len(entry) > 1) else 1.0
+
+    return weights
+
+
+def main():
+    """
+    --------------------------------------------------------
+    Builds a weights file from the command line.
+    Use: python Weights.py answers.txt
+    Use: python Weights.py words.txt --first 2309
+    Use: python Weights.py frequencies.txt --floor 0.001
+    --------------------------------------------------------
+    Parameters:
+        None
+    Returns:
+        None
+    --------------------------------------------------------
+    """
+    from Engine import WORDS_FILE, WordEngine
+
+    parser = argparse.ArgumentParser(description="Builds the prior weight of every word.")
+    parser.add_argument("source", help="list of words, or 'word weight' lines")
+    parser.add_argument("--floor", type=float, default=0.0, help="weight of the words not in the source")
+    parser.add_argument("--first", type=int, help="only use the first FIRST words of the source")
+    parser.add_argument("--words", default=WORDS_FILE, help="the word list the weights are for")
+    parser.add_argument("--output", help="where the weights are written (default: next to the word list)")
+    args = parser.parse_args()
+
+    engine = WordEngine.load(args.words)
+    weights = read_weights(engine, args.source, args.floor, args.first)
+    output = args.output or weights_name(args.words)
+    save_weights(output, weights, engine.digest())
+
+    print("Wrote {:} weights to {:} ({:} words above the floor)".format(len(weights), output,
+                                                                          int(np.sum(weights > args.floor))))
+
+
+if(__name__ == "__main__"):
+    main()